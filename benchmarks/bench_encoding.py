@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark tool response encoding for representative pulsar_consume and
+pulsar_topic_stats results.
+
+Usage: python benchmarks/bench_encoding.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pulsar_mcp_server.encoding import encode_result, orjson  # noqa: E402
+
+
+def consume_result(message_count: int = 100, payload_size: int = 2048) -> dict:
+    """Build a pulsar_consume result with JSON-ish payloads."""
+    payload = ('{"event":"order_created","items":[' + ",".join(['{"sku":"A-1","qty":2}'] * 64) + "]}")
+    payload = (payload * (payload_size // len(payload) + 1))[:payload_size]
+    messages = [
+        {
+            "message_id": f"(123,{i},-1,-1)",
+            "data": payload,
+            "properties": {"source": "orders-service", "trace_id": f"{i:032x}"},
+            "topic": "persistent://public/default/orders",
+            "publish_timestamp": 1760000000000 + i,
+            "event_timestamp": 0,
+        }
+        for i in range(message_count)
+    ]
+    return {
+        "status": "success",
+        "topic": "orders",
+        "subscription": "bench",
+        "message_count": len(messages),
+        "messages": messages,
+    }
+
+
+def topic_stats_result(publishers: int = 50, subscriptions: int = 20, consumers: int = 10) -> dict:
+    """Build a pulsar_topic_stats result shaped like a busy broker topic."""
+    def rates():
+        return {
+            "msgRateIn": 1523.42,
+            "msgThroughputIn": 3120456.7,
+            "msgRateOut": 1498.12,
+            "msgThroughputOut": 3050123.1,
+            "averageMsgSize": 2048.3,
+        }
+
+    stats = {
+        **rates(),
+        "storageSize": 9876543210,
+        "backlogSize": 123456789,
+        "publishers": [
+            {**rates(), "producerId": i, "producerName": f"producer-{i}",
+             "address": f"/10.0.0.{i % 255}:5{i:04d}", "connectedSince": "2026-10-01T10:00:00Z",
+             "clientVersion": "3.4.0", "metadata": {}}
+            for i in range(publishers)
+        ],
+        "subscriptions": {
+            f"sub-{s}": {
+                **rates(),
+                "msgBacklog": 1000 * s,
+                "type": "Shared",
+                "unackedMessages": 12,
+                "consumers": [
+                    {**rates(), "consumerName": f"consumer-{s}-{c}", "availablePermits": 1000,
+                     "unackedMessages": 3, "address": f"/10.0.1.{c}:6{c:04d}",
+                     "connectedSince": "2026-10-01T10:00:00Z", "clientVersion": "3.4.0",
+                     "metadata": {}}
+                    for c in range(consumers)
+                ],
+            }
+            for s in range(subscriptions)
+        },
+        "replication": {},
+        "deduplicationStatus": "Disabled",
+    }
+    return {"status": "success", "topic": "orders", "stats": stats}
+
+
+def bench(result: dict, encoder: str, compact: bool, repeat: int) -> tuple:
+    """Return (encoded bytes, mean milliseconds per encode)."""
+    text = encode_result(result, encoder=encoder, compact=compact)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encode_result(result, encoder=encoder, compact=compact)
+    elapsed = time.perf_counter() - start
+    return len(text.encode("utf-8")), elapsed / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="encodes per measurement")
+    args = parser.parse_args()
+
+    workloads = {
+        "pulsar_consume (100 x 2KB)": consume_result(),
+        "pulsar_topic_stats (busy topic)": topic_stats_result(),
+    }
+    variants = [("json", False), ("json", True)]
+    if orjson is not None:
+        variants += [("orjson", False), ("orjson", True)]
+    else:
+        print("orjson is not installed; skipping orjson variants\n")
+
+    print(f"{'workload':<34} {'encoder':<8} {'mode':<8} {'bytes':>10} {'vs indent':>10} {'ms':>9}")
+    for name, result in workloads.items():
+        baseline_bytes, _ = bench(result, "json", False, 1)
+        for encoder, compact in variants:
+            size, ms = bench(result, encoder, compact, args.repeat)
+            mode = "compact" if compact else "indent"
+            print(f"{name:<34} {encoder:<8} {mode:<8} {size:>10} {size / baseline_bytes:>9.0%} {ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
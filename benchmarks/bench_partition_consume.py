@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs partition-parallel pulsar_consume against a live broker.
+
+For each partition count a fresh partitioned topic is created and filled,
+then drained once with a single consumer and once with one consumer per
+partition. Requires a running Pulsar cluster (PULSAR_SERVICE_URL and
+PULSAR_WEB_SERVICE_URL, as for the server).
+
+Usage: python benchmarks/bench_partition_consume.py [--partitions 1 2 4 8] [--messages N] [--time-limit S]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pulsar_mcp_server.pulsar_connector import PulsarConnector  # noqa: E402
+from pulsar_mcp_server.settings import settings  # noqa: E402
+
+
+async def fill_topic(connector: PulsarConnector, topic: str, message_count: int, payload_size: int):
+    """Publish message_count messages spread over the topic's partitions by key."""
+    payload = "x" * payload_size
+    for start in range(0, message_count, 1000):
+        batch = [
+            {"message": payload, "key": str(i)}
+            for i in range(start, min(start + 1000, message_count))
+        ]
+        await connector.publish_batch(topic, batch)
+
+
+async def drain(connector: PulsarConnector, topic: str, subscription: str, message_count: int,
+                parallel: bool, page_size: int, parallelism: int, time_limit: float) -> tuple:
+    """Consume until message_count messages arrived or time_limit passed; return (messages, seconds).
+    
+    An empty page only means nothing was ready within the receive wait, so
+    polling goes on until the whole backlog is in or the time limit is hit.
+    """
+    received = 0
+    start = time.perf_counter()
+    start_position = "earliest"
+    while received < message_count and time.perf_counter() - start < time_limit:
+        if parallel:
+            messages = await connector.consume_partitions(
+                topic, subscription, page_size, "Shared", start_position=start_position, parallelism=parallelism
+            )
+        else:
+            messages = await connector.consume_messages(
+                topic, subscription, page_size, "Shared", start_position=start_position
+            )
+        # Seek once; later pages continue from the subscription's cursor
+        start_position = None
+        received += len(messages)
+    return received, time.perf_counter() - start
+
+
+async def run(args):
+    connector = PulsarConnector()
+    if not await connector.connect():
+        sys.exit(f"Cannot connect to Pulsar at {settings.pulsar_service_url}")
+
+    print(f"{'partitions':>10} {'mode':<10} {'messages':>9} {'seconds':>9} {'msg/s':>10} {'speedup':>8}")
+    try:
+        for partitions in args.partitions:
+            topic = f"bench-partitions-{partitions}-{uuid.uuid4().hex[:8]}"
+            if not await connector.create_topic(topic, partitions):
+                print(f"Skipping {partitions} partitions: topic creation failed")
+                continue
+
+            await fill_topic(connector, topic, args.messages, args.payload_size)
+
+            baseline = None
+            for mode, parallel in (("single", False), ("parallel", True)):
+                # A fresh subscription per mode so both drain the same backlog
+                subscription = f"bench-{mode}-{uuid.uuid4().hex[:8]}"
+                received, seconds = await drain(
+                    connector, topic, subscription, args.messages, parallel, args.page_size, args.parallelism,
+                    args.time_limit
+                )
+                if received < args.messages:
+                    print(f"{partitions:>10} {mode:<10} only {received} of {args.messages} messages within {args.time_limit}s")
+                rate = received / seconds if seconds else 0.0
+                baseline = baseline or rate
+                print(f"{partitions:>10} {mode:<10} {received:>9} {seconds:>9.3f} {rate:>10.0f} {rate / baseline:>7.2f}x")
+
+            await connector.delete_topic(topic)
+    finally:
+        await connector.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--partitions", type=int, nargs="+", default=[1, 2, 4, 8], help="partition counts to test")
+    parser.add_argument("--messages", type=int, default=20000, help="messages published per topic")
+    parser.add_argument("--payload-size", type=int, default=512, help="payload bytes per message")
+    parser.add_argument("--page-size", type=int, default=100, help="max_messages per consume call")
+    parser.add_argument("--parallelism", type=int, default=8, help="partitions received from at once")
+    parser.add_argument("--time-limit", type=float, default=120.0, help="seconds allowed to drain each backlog")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
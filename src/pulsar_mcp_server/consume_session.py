@@ -0,0 +1,47 @@
+import secrets
+import time
+from typing import Any, Dict, Optional
+
+import pulsar
+from pulsar import ConsumerType
+
+from .message_filter import MessageFilter
+
+
+def new_cursor() -> str:
+    """Return an opaque, unguessable cursor for a new consume session."""
+    return secrets.token_urlsafe(16)
+
+
+class ConsumeSession:
+    """A dedicated consumer held between pulsar_consume_page calls.
+
+    The session owns its consumer, so successive pages continue from the
+    consumer's receive queue without re-subscribing. Closing the session
+    closes the consumer, which lets sessions live in a ResourcePool.
+    """
+
+    def __init__(self, consumer: pulsar.Consumer, topic: str, subscription_name: str,
+                 consumer_type: ConsumerType, message_filter: Optional[MessageFilter] = None):
+        self.consumer = consumer
+        self.topic = topic
+        self.subscription_name = subscription_name
+        self.consumer_type = consumer_type
+        self.message_filter = message_filter
+        self.delivered = 0
+        self.pages = 0
+        self.created = time.monotonic()
+
+    def close(self):
+        """Close the session's consumer; the subscription itself is kept."""
+        self.consumer.close()
+
+    def describe(self) -> Dict[str, Any]:
+        """Return the session's topic, subscription and progress."""
+        return {
+            "topic": self.topic,
+            "subscription": self.subscription_name,
+            "pages": self.pages,
+            "delivered_total": self.delivered,
+            "age_seconds": round(time.monotonic() - self.created, 3),
+        }
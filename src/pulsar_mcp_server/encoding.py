@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+ENCODERS = ("auto", "json", "orjson")
+
+
+def encode_result(result: Any, encoder: str = "auto", compact: bool = True) -> str:
+    """Serialize a tool result to JSON text.
+
+    ``encoder`` selects the backend: "orjson", "json" for the standard
+    library, or "auto" to prefer orjson. Both "auto" and "orjson" fall back
+    to json when orjson is not installed.
+    ``compact`` drops indentation and separator whitespace.
+    """
+    if encoder not in ENCODERS:
+        raise ValueError(f"Unknown response encoder: {encoder}. Must be one of {', '.join(ENCODERS)}")
+
+    # Values neither backend serializes natively (e.g. MessageId) fall back to str()
+    if encoder != "json" and orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(result, default=str, option=option).decode("utf-8")
+
+    if compact:
+        return json.dumps(result, separators=(",", ":"), ensure_ascii=False, default=str)
+    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
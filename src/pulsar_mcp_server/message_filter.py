@@ -0,0 +1,123 @@
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import pulsar
+
+from .projection import resolve_path
+
+
+class MessageFilter:
+    """Predicate over received messages, evaluated before they are returned.
+
+    All given conditions must hold: exact property values, the partition key,
+    a regex searched in the UTF-8 payload, and a JSON path into the payload
+    that must exist or, when json_value is given, equal it.
+    """
+
+    def __init__(self, properties: Optional[Dict[str, str]] = None, key: Optional[str] = None,
+                 payload_regex: Optional[str] = None, json_path: Optional[str] = None,
+                 json_value: Any = None, match_json_value: bool = False):
+        self.properties = properties or {}
+        self.key = key
+        self.payload_regex = re.compile(payload_regex) if payload_regex else None
+        self.json_path = json_path
+        self.json_value = json_value
+        self.match_json_value = match_json_value
+
+    @classmethod
+    def from_dict(cls, spec: Optional[Dict[str, Any]]) -> Optional["MessageFilter"]:
+        """Build a filter from a tool argument, or None when no condition is set."""
+        if not spec:
+            return None
+        try:
+            return cls(
+                properties=spec.get("properties"),
+                key=spec.get("key"),
+                payload_regex=spec.get("payload_regex"),
+                json_path=spec.get("json_path"),
+                json_value=spec.get("json_value"),
+                match_json_value="json_value" in spec,
+            )
+        except re.error as e:
+            raise ValueError(f"Invalid payload_regex: {e}")
+
+    def matches(self, msg: pulsar.Message) -> bool:
+        """Return True if the message satisfies every condition."""
+        if self.properties:
+            props = msg.properties()
+            if any(props.get(name) != value for name, value in self.properties.items()):
+                return False
+
+        if self.key is not None and msg.partition_key() != self.key:
+            return False
+
+        if self.payload_regex is None and self.json_path is None:
+            return True
+
+        text = msg.data().decode("utf-8", errors="replace")
+
+        if self.payload_regex is not None and not self.payload_regex.search(text):
+            return False
+
+        if self.json_path is not None:
+            try:
+                values = resolve_path(json.loads(text), self.json_path)
+            except ValueError:
+                return False
+            if not values:
+                return False
+            if self.match_json_value and self.json_value not in values:
+                return False
+
+        return True
+
+
+class ScanBudget:
+    """Limits on how much a filtered read may scan before giving up.
+
+    Tracks scanned messages and payload bytes plus elapsed time; once any
+    limit is reached, exhausted_reason names it. One budget may be shared by
+    receive loops running on several executor threads.
+    """
+
+    def __init__(self, max_messages: int, max_bytes: int, max_seconds: float):
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.scanned_messages = 0
+        self.scanned_bytes = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Restart the clock, e.g. once the reader or consumer is ready."""
+        self._started = time.monotonic()
+
+    def record(self, msg: pulsar.Message):
+        """Count a message as scanned."""
+        size = len(msg.data())
+        with self._lock:
+            self.scanned_messages += 1
+            self.scanned_bytes += size
+
+    @property
+    def exhausted_reason(self) -> Optional[str]:
+        if self.scanned_messages >= self.max_messages:
+            return "max_scanned_messages"
+        if self.scanned_bytes >= self.max_bytes:
+            return "max_scanned_bytes"
+        if time.monotonic() - self._started >= self.max_seconds:
+            return "max_scan_seconds"
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return what was scanned and why scanning stopped early, if it did."""
+        return {
+            "scanned_messages": self.scanned_messages,
+            "scanned_bytes": self.scanned_bytes,
+            "elapsed_seconds": round(time.monotonic() - self._started, 3),
+            "budget_exhausted": self.exhausted_reason,
+        }
@@ -0,0 +1,82 @@
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+import pulsar
+
+PAYLOAD_MODES = ("full", "truncate", "metadata")
+
+
+class PayloadFormat:
+    """Controls how much of each payload a consume or peek result carries.
+
+    "full" returns the whole payload, "truncate" its first max_payload_bytes
+    and "metadata" none of it; the latter two add the payload size and SHA-256
+    so a message can still be identified. Only returned payloads are decoded.
+    max_response_bytes caps the payload and property bytes of a whole result;
+    the first message is always admitted so a result is never empty because
+    of the budget alone. admit() is safe to call from several executor threads.
+    """
+
+    def __init__(self, mode: str = "full", max_payload_bytes: int = 1024,
+                 max_response_bytes: Optional[int] = None):
+        if mode not in PAYLOAD_MODES:
+            raise ValueError(f"Invalid payload mode: {mode}")
+        self.mode = mode
+        self.max_payload_bytes = max(0, max_payload_bytes)
+        self.max_response_bytes = max_response_bytes
+        self.response_bytes = 0
+        self.admitted = 0
+        self.exhausted = False
+        self._lock = threading.Lock()
+
+    def returned_size(self, msg: pulsar.Message) -> int:
+        """Bytes the message will add to the result, before decoding."""
+        size = sum(len(name) + len(value) for name, value in msg.properties().items())
+        if self.mode == "full":
+            return size + len(msg.data())
+        if self.mode == "truncate":
+            return size + min(len(msg.data()), self.max_payload_bytes)
+        return size
+
+    def admit(self, msg: pulsar.Message) -> bool:
+        """Account for a message about to be returned; False once the response budget is spent."""
+        if self.exhausted:
+            return False
+
+        size = self.returned_size(msg)
+        with self._lock:
+            if self.exhausted:
+                return False
+            if (self.max_response_bytes is not None and self.admitted
+                    and self.response_bytes + size > self.max_response_bytes):
+                self.exhausted = True
+                return False
+
+            self.response_bytes += size
+            self.admitted += 1
+            return True
+
+    def payload_fields(self, msg: pulsar.Message) -> Dict[str, Any]:
+        """Return the payload-related fields of a message dictionary."""
+        data = msg.data()
+        if self.mode == "full":
+            return {"data": data.decode("utf-8", errors="replace")}
+
+        fields: Dict[str, Any] = {
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        if self.mode == "truncate":
+            fields["data"] = data[:self.max_payload_bytes].decode("utf-8", errors="replace")
+            fields["truncated"] = len(data) > self.max_payload_bytes
+        return fields
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the mode and how much of the response budget was used."""
+        return {
+            "mode": self.mode,
+            "response_bytes": self.response_bytes,
+            "max_response_bytes": self.max_response_bytes,
+            "budget_exhausted": self.exhausted,
+        }
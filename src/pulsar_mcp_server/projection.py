@@ -0,0 +1,108 @@
+from typing import Any, Dict, List
+
+# Marker for a path selected in full (its whole subtree is kept)
+_LEAF: Dict[str, Any] = {}
+# Marker for a branch with no matching fields
+_MISSING = object()
+
+
+def parse_paths(paths: List[str]) -> Dict[str, Any]:
+    """Compile dotted field paths into a selection tree.
+
+    Paths are dot-separated keys with an optional leading "$." as in JSONPath.
+    "*" matches every key of an object or every item of a list, and a numeric
+    segment selects a list index, e.g. "subscriptions.*.msgBacklog".
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        segments = _split(path)
+        if not segments:
+            continue
+
+        node = tree
+        for segment in segments[:-1]:
+            child = node.get(segment)
+            if child is _LEAF:
+                break
+            node = node.setdefault(segment, {})
+        else:
+            node[segments[-1]] = _LEAF
+    return tree
+
+
+def project(document: Any, paths: List[str]) -> Any:
+    """Return a copy of document containing only the fields selected by paths.
+
+    Only the selected branches are visited, so unrequested parts of large
+    documents are never copied.
+    """
+    tree = parse_paths(paths)
+    if not tree:
+        return document
+    projected = _project(document, tree)
+    return projected if projected is not _MISSING else {}
+
+
+def resolve_path(document: Any, path: str) -> List[Any]:
+    """Return every value matched by a single dotted path."""
+    values = [document]
+    for segment in _split(path):
+        matched = []
+        for value in values:
+            matched.extend(_children(value, segment))
+        values = matched
+    return values
+
+
+def _split(path: str) -> List[str]:
+    path = path.strip()
+    if path.startswith("$"):
+        path = path[1:].lstrip(".")
+    return [segment for segment in path.split(".") if segment]
+
+
+def _children(value: Any, segment: str) -> List[Any]:
+    if isinstance(value, dict):
+        if segment == "*":
+            return list(value.values())
+        return [value[segment]] if segment in value else []
+    if isinstance(value, list):
+        if segment == "*":
+            return list(value)
+        if segment.lstrip("-").isdigit() and -len(value) <= int(segment) < len(value):
+            return [value[int(segment)]]
+    return []
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if tree is _LEAF:
+        return value
+
+    if isinstance(value, dict):
+        result = {}
+        for segment, subtree in tree.items():
+            keys = value.keys() if segment == "*" else ([segment] if segment in value else [])
+            for key in keys:
+                projected = _project(value[key], subtree)
+                if projected is _MISSING:
+                    continue
+                if isinstance(result.get(key), dict) and isinstance(projected, dict):
+                    # A wildcard and an explicit key selected different fields of the same object
+                    result[key] = {**result[key], **projected}
+                else:
+                    result[key] = projected
+        return result or _MISSING
+
+    if isinstance(value, list):
+        wildcard = tree.get("*")
+        result = []
+        for index, item in enumerate(value):
+            subtree = wildcard if wildcard is not None else tree.get(str(index))
+            if subtree is None:
+                continue
+            projected = _project(item, subtree)
+            if projected is not _MISSING:
+                result.append(projected)
+        return result or _MISSING
+
+    return _MISSING
@@ -1,24 +1,224 @@
 import asyncio
+import functools
+import importlib.util
 import logging
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import _pulsar
+import httpx
 import pulsar
 from pulsar import ConsumerType, InitialPosition
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Deque, Pattern, Tuple, Union
+from .cache import TTLCache
+from .consume_session import ConsumeSession, new_cursor
+from .message_filter import MessageFilter, ScanBudget
+from .payload_format import PayloadFormat
+from .projection import project
+from .resource_pool import ResourceGroup, ResourcePool
 from .settings import settings
+from .stats_poller import TopicSeries
+from .topic_stats import PARTITION_METRICS, aggregate_partitions, derive_rates, summarize_partition, take_snapshot
 
 logger = logging.getLogger(__name__)
 
+# Admin API base path for each kind of connector, in lookup precedence order
+CONNECTOR_KIND_PATHS = {
+    "function": "/admin/v3/functions/public/default",
+    "source": "/admin/v3/sources/public/default",
+    "sink": "/admin/v3/sinks/public/default"
+}
+
+TOPICS_PATH = "/admin/v2/persistent/public/default"
+
+CONSUMER_TYPES = {
+    "Exclusive": ConsumerType.Exclusive,
+    "Shared": ConsumerType.Shared,
+    "Failover": ConsumerType.Failover,
+    "KeyShared": ConsumerType.KeyShared
+}
+
+# Extra time the awaiting side allows a receive loop past its deadline, so the
+# loop can stop and acknowledge what it returns before the caller gives up on it
+RECEIVE_DEADLINE_GRACE_SECONDS = 1.0
+
+# pulsar.MessageId.earliest/latest are instances of the extension type, not of the
+# pulsar.MessageId wrapper that parse_message_id returns
+MESSAGE_ID_TYPES = (pulsar.MessageId, _pulsar.MessageId)
+
+# What a consumer subscribes to: one topic, a list of topics or a regex pattern
+SubscriptionTopic = Union[str, List[str], Pattern[str]]
+
+# What a receive loop reads from
+Receiver = Union[pulsar.Consumer, pulsar.Reader]
+
+
+def subscription_topic(topic: Optional[str] = None, topics: Optional[List[str]] = None,
+                       topic_pattern: Optional[str] = None) -> SubscriptionTopic:
+    """Pick the subscription target from tool arguments, most specific first.
+    
+    A pattern without a scheme is taken to be in the public/default namespace,
+    since the broker matches patterns against fully qualified topic names.
+    """
+    if topic_pattern:
+        if "://" not in topic_pattern:
+            topic_pattern = f"persistent://public/default/{topic_pattern}"
+        try:
+            return re.compile(topic_pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid topic_pattern: {e}")
+    if topics:
+        return list(topics) if len(topics) > 1 else topics[0]
+    return topic
+
+
+def describe_topic(topic: SubscriptionTopic) -> str:
+    """Return a readable label for a subscription target."""
+    if isinstance(topic, re.Pattern):
+        return topic.pattern
+    if isinstance(topic, list):
+        return ",".join(topic)
+    return topic
+
+
+def parse_message_id(text: str) -> pulsar.MessageId:
+    """Parse a message ID as printed by str(MessageId), e.g. "(123,45,-1,-1)".
+    
+    "ledger:entry[:partition[:batch_index]]" is accepted too.
+    """
+    parts = [int(part) for part in text.strip().strip("()").replace(":", ",").split(",")]
+    if not 2 <= len(parts) <= 4:
+        raise ValueError(f"Invalid message ID: {text}")
+    ledger_id, entry_id, *rest = parts
+    partition = rest[0] if len(rest) > 0 else -1
+    batch_index = rest[1] if len(rest) > 1 else -1
+    return pulsar.MessageId(partition, ledger_id, entry_id, batch_index)
+
 
 class PulsarConnector:
     """Pulsar connector for MCP server operations."""
     
     def __init__(self):
         self.client: Optional[pulsar.Client] = None
-        self.producer: Optional[pulsar.Producer] = None
-        self.consumer: Optional[pulsar.Consumer] = None
+        self.producers = ResourcePool(
+            "producer",
+            settings.producer_pool_max_size,
+            settings.producer_pool_idle_timeout_seconds
+        )
+        self.consumers = ResourcePool(
+            "consumer",
+            settings.consumer_pool_max_size,
+            settings.consumer_pool_idle_timeout_seconds
+        )
+        # One entry per partitioned topic, subscription and type, holding a consumer per partition
+        self.partition_consumers = ResourcePool(
+            "partition_consumers",
+            settings.partition_consumer_pool_max_size,
+            settings.consumer_pool_idle_timeout_seconds
+        )
+        self.readers = ResourcePool(
+            "reader",
+            settings.reader_pool_max_size,
+            settings.reader_pool_idle_timeout_seconds
+        )
+        self.consume_sessions = ResourcePool(
+            "consume_session",
+            settings.consume_session_max_count,
+            settings.consume_session_idle_timeout_seconds
+        )
+        self.connector_kinds = TTLCache(
+            "connector_kind",
+            settings.connector_kind_cache_ttl_seconds,
+            settings.connector_kind_cache_max_entries
+        )
+        self.admin_cache = TTLCache(
+            "admin",
+            settings.admin_cache_topic_stats_ttl_seconds,
+            settings.admin_cache_max_entries,
+            stale_seconds=settings.admin_cache_stale_seconds
+        )
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        # Bumped by every invalidation; a fetch that started before one does not write to the cache
+        self._admin_cache_epoch = 0
+        # Snapshot history per topic; ad-hoc topics are kept LRU, see _tracked_stats_entry
+        self._stats_history: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        self.stats_series: "OrderedDict[str, TopicSeries]" = OrderedDict()
+        # Messages a receive loop took from a consumer or reader but did not return, served first next time
+        self._pending: "weakref.WeakKeyDictionary[Receiver, Deque[pulsar.Message]]" = weakref.WeakKeyDictionary()
+        self._pending_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._send_executor: Optional[ThreadPoolExecutor] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
         self._is_connected = False
+        # Serializes connect() so concurrent first calls share one client
+        self._connect_lock = asyncio.Lock()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the dedicated executor for blocking client calls, creating it lazily."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.blocking_executor_max_workers),
+                thread_name_prefix="pulsar-blocking"
+            )
+        return self._executor
+    
+    def _get_send_executor(self) -> ThreadPoolExecutor:
+        """Return the single-thread executor for sends that may block, keeping them in order."""
+        if self._send_executor is None:
+            self._send_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pulsar-send")
+        return self._send_executor
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any,
+                            timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Run a blocking pulsar client call on the executor with a timeout.
+        
+        On timeout the awaiting coroutine gets asyncio.TimeoutError; the worker
+        thread itself cannot be interrupted and finishes the call in the background.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        return await asyncio.wait_for(
+            loop.run_in_executor(self._get_executor(), call),
+            timeout=timeout if timeout is not None else settings.pulsar_operation_timeout_seconds
+        )
+    
+    async def _create_resource(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client, producer, consumer or reader factory on the executor.
+        
+        If the caller times out or is cancelled, the factory still finishes on
+        its worker thread; whatever it creates then is closed instead of leaked.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=settings.pulsar_operation_timeout_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            future.add_done_callback(self._close_abandoned)
+            raise
+    
+    def _close_abandoned(self, future: asyncio.Future):
+        """Close a resource whose creation finished after its caller gave up."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        resource = future.result()
+        logger.warning(f"Closing {type(resource).__name__} created after its caller timed out")
+        try:
+            self._get_executor().submit(resource.close)
+        except Exception as e:
+            logger.warning(f"Error closing abandoned {type(resource).__name__}: {e}")
     
     async def connect(self) -> bool:
-        """Connect to Pulsar cluster."""
+        """Connect to Pulsar cluster; concurrent callers wait for a single connection attempt."""
+        async with self._connect_lock:
+            if self._is_connected:
+                return True
+            return await self._connect()
+    
+    async def _connect(self) -> bool:
+        """Create the Pulsar client. Called with the connect lock held."""
         try:
             # Build client configuration
             client_config = {
@@ -34,7 +234,7 @@ class PulsarConnector:
                 client_config['tls_trust_certs_file_path'] = settings.pulsar_tls_trust_certs_file_path
                 client_config['tls_allow_insecure_connection'] = settings.pulsar_tls_allow_insecure_connection
             
-            self.client = pulsar.Client(**client_config)
+            self.client = await self._create_resource(pulsar.Client, **client_config)
             self._is_connected = True
             logger.info(f"Connected to Pulsar at {settings.pulsar_service_url}")
             return True
@@ -47,18 +247,32 @@ class PulsarConnector:
     async def disconnect(self):
         """Disconnect from Pulsar cluster."""
         try:
-            if self.consumer:
-                self.consumer.close()
-                self.consumer = None
-            
-            if self.producer:
-                self.producer.close()
-                self.producer = None
+            await self._close_resources(self.consume_sessions.drain())
+            await self._close_resources(self.consumers.drain())
+            await self._close_resources(self.partition_consumers.drain())
+            await self._close_resources(self.readers.drain())
+            await self._close_resources(self.producers.drain())
             
             if self.client:
-                self.client.close()
+                await self._run_blocking(self.client.close)
                 self.client = None
             
+            for task in list(self._refresh_tasks.values()):
+                task.cancel()
+            self._refresh_tasks.clear()
+            
+            if self._http_client:
+                await self._http_client.aclose()
+                self._http_client = None
+            
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            
+            if self._send_executor:
+                self._send_executor.shutdown(wait=False)
+                self._send_executor = None
+            
             self._is_connected = False
             logger.info("Disconnected from Pulsar")
             
@@ -71,18 +285,11 @@ class PulsarConnector:
             if not self._is_connected:
                 await self.connect()
             
-            if not self.producer or self.producer.topic() != topic:
-                if self.producer:
-                    self.producer.close()
-                
-                self.producer = self.client.create_producer(
-                    topic,
-                    send_timeout_millis=30000,
-                    batching_enabled=True
-                )
+            producer = await self._get_producer(topic)
             
-            # Send message
-            message_id = self.producer.send(
+            # Send without blocking the event loop; the broker ack resolves the future
+            message_id = await self._send_async(
+                producer,
                 message.encode('utf-8'),
                 properties=properties or {}
             )
@@ -94,93 +301,920 @@ class PulsarConnector:
             logger.error(f"Failed to publish message to topic {topic}: {e}")
             return False
     
-    async def consume_messages(self, topic: str, subscription_name: str, max_messages: int = 10) -> List[Dict[str, Any]]:
-        """Consume messages from a Pulsar topic."""
+    async def publish_batch(self, topic: str, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Publish a batch of messages to a Pulsar topic with pipelined sends."""
+        results: List[Dict[str, Any]] = []
+        start = time.perf_counter()
+        
         try:
             if not self._is_connected:
                 await self.connect()
             
-            # Create consumer if not exists or topic changed
-            if not self.consumer or self.consumer.topic() != topic:
-                if self.consumer:
-                    self.consumer.close()
-                
-                # Determine consumer type
-                consumer_type_map = {
-                    "Exclusive": ConsumerType.Exclusive,
-                    "Shared": ConsumerType.Shared,
-                    "Failover": ConsumerType.Failover,
-                    "KeyShared": ConsumerType.KeyShared
-                }
+            producer = await self._get_producer(topic)
+            
+            # Bound the sends awaiting a broker ack so the producer queue never overflows
+            max_in_flight = settings.publish_batch_max_in_flight
+            if settings.producer_max_pending_messages > 0:
+                max_in_flight = min(max_in_flight, settings.producer_max_pending_messages)
+            in_flight = asyncio.Semaphore(max(1, max_in_flight))
+            futures: List[asyncio.Future] = []
+            
+            try:
+                for item in messages:
+                    await in_flight.acquire()
+                    
+                    try:
+                        send_kwargs: Dict[str, Any] = {'properties': item.get('properties') or {}}
+                        if item.get('key'):
+                            send_kwargs['partition_key'] = item['key']
+                        if item.get('event_timestamp') is not None:
+                            send_kwargs['event_timestamp'] = int(item['event_timestamp'])
+                        
+                        future = self._send_async(producer, item['message'].encode('utf-8'), **send_kwargs)
+                    except Exception as e:
+                        # A bad entry fails on its own; the rest of the batch is still sent
+                        in_flight.release()
+                        future = asyncio.get_running_loop().create_future()
+                        future.set_exception(e)
+                    else:
+                        future.add_done_callback(lambda _: in_flight.release())
+                    
+                    futures.append(future)
+            finally:
+                # Report every send already handed to the producer, even if the loop stopped early
+                outcomes = await asyncio.gather(*futures, return_exceptions=True)
                 
-                consumer_type = consumer_type_map.get(
-                    settings.subscription_type, 
-                    ConsumerType.Shared
+                for index, outcome in enumerate(outcomes):
+                    if isinstance(outcome, BaseException):
+                        results.append({'index': index, 'status': 'error', 'error': str(outcome) or type(outcome).__name__})
+                    else:
+                        results.append({'index': index, 'status': 'success', 'message_id': str(outcome)})
+            
+        except Exception as e:
+            logger.error(f"Failed to publish batch to topic {topic}: {e}")
+            for index in range(len(results), len(messages)):
+                results.append({'index': index, 'status': 'error', 'error': str(e)})
+        
+        elapsed = time.perf_counter() - start
+        succeeded = sum(1 for r in results if r['status'] == 'success')
+        logger.info(f"Published {succeeded}/{len(messages)} messages to topic {topic} in {elapsed:.3f}s")
+        
+        return {
+            'topic': topic,
+            'total': len(messages),
+            'succeeded': succeeded,
+            'failed': len(messages) - succeeded,
+            'elapsed_ms': round(elapsed * 1000, 3),
+            'messages_per_second': round(succeeded / elapsed, 2) if elapsed > 0 else None,
+            'results': results
+        }
+    
+    def _send_async(self, producer: pulsar.Producer, content: bytes, **kwargs: Any) -> asyncio.Future:
+        """Send a message with send_async and return an asyncio future for its message ID.
+        
+        With producer_block_if_queue_full, send_async waits for queue space, so
+        it is called on a single-thread executor instead of the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def _resolve(res, msg_id):
+            if future.done():
+                return
+            if res == pulsar.Result.Ok:
+                future.set_result(msg_id)
+            else:
+                future.set_exception(pulsar.PulsarException(f"Send failed: {res}"))
+        
+        def _callback(res, msg_id):
+            # Invoked on a pulsar client thread; hand the result back to the loop.
+            # Exceptions escaping this callback would abort the process.
+            try:
+                loop.call_soon_threadsafe(_resolve, res, msg_id)
+            except RuntimeError:
+                logger.warning("Event loop closed before send completed")
+        
+        def _submitted(call: asyncio.Future):
+            # send_async raised before the message was queued; its callback will not run
+            if not call.cancelled() and call.exception() is not None and not future.done():
+                future.set_exception(call.exception())
+        
+        if settings.producer_block_if_queue_full:
+            call = loop.run_in_executor(
+                self._get_send_executor(),
+                functools.partial(producer.send_async, content, _callback, **kwargs)
+            )
+            call.add_done_callback(_submitted)
+        else:
+            producer.send_async(content, _callback, **kwargs)
+        return future
+    
+    async def _get_producer(self, topic: str, **options: Any) -> pulsar.Producer:
+        """Return a pooled producer for the topic and options, creating it on a miss."""
+        producer_options = {**self._producer_options(), **options}
+        key = (topic, tuple(sorted(producer_options.items())))
+        
+        await self._close_resources(self.producers.evict_idle())
+        
+        producer = self.producers.get(key)
+        if producer is None:
+            producer = await self._create_resource(self.client.create_producer, topic, **producer_options)
+            
+            # Another call may have created the same producer while this one was waiting
+            if key in self.producers:
+                await self._close_resources([producer])
+                return self.producers.get(key)
+            
+            await self._close_resources(self.producers.put(key, producer))
+            logger.info(f"Created producer for topic {topic} ({len(self.producers)} pooled)")
+        
+        return producer
+    
+    async def _get_consumer(self, topic: SubscriptionTopic, subscription_name: str,
+                            subscription_type: Optional[str] = None) -> pulsar.Consumer:
+        """Return a pooled consumer for the topic(s), subscription and type, subscribing on a miss."""
+        consumer_type = self._resolve_consumer_type(subscription_type)
+        key = (self._topic_key(topic), subscription_name, consumer_type)
+        
+        await self._close_resources(self.consumers.evict_idle())
+        
+        consumer = self.consumers.get(key)
+        if consumer is None:
+            if consumer_type == ConsumerType.Exclusive:
+                # Exclusive partition consumers on the same subscription would make this subscribe fail
+                await self._close_resources(self._pop_resource(self.partition_consumers, key))
+            consumer = await self._subscribe(topic, subscription_name, consumer_type)
+            
+            if key in self.consumers:
+                await self._close_resources([consumer])
+                return self.consumers.get(key)
+            
+            await self._close_resources(self.consumers.put(key, consumer))
+            logger.info(f"Subscribed to topic {describe_topic(topic)} as {subscription_name} ({len(self.consumers)} pooled)")
+        
+        return consumer
+    
+    async def _get_partition_consumers(self, topic: str, partitions: List[str], subscription_name: str,
+                                       consumer_type: ConsumerType, parallelism: int) -> Dict[str, pulsar.Consumer]:
+        """Return a consumer per partition, subscribing the missing ones concurrently.
+        
+        A topic's partition consumers are pooled as one group in their own
+        pool, so the group always holds every partition however many there
+        are, and the consumer pool's LRU cannot close some of them mid-call.
+        """
+        key = (topic, subscription_name, consumer_type)
+        
+        await self._close_resources(self.partition_consumers.evict_idle())
+        
+        group = self.partition_consumers.get(key)
+        if group is None:
+            if consumer_type == ConsumerType.Exclusive:
+                # A pooled Exclusive consumer on the whole topic holds every partition of the subscription
+                await self._close_resources(self._pop_resource(self.consumers, key))
+            group = ResourceGroup()
+            await self._close_resources(self.partition_consumers.put(key, group))
+        
+        missing = [partition for partition in partitions if partition not in group.members]
+        subscribed = await self._gather_bounded(
+            lambda partition: self._subscribe(partition, subscription_name, consumer_type),
+            missing,
+            parallelism
+        )
+        duplicates = []
+        for partition, result in zip(missing, subscribed):
+            if isinstance(result, Exception):
+                continue
+            # Another call may have subscribed the same partition while this one was waiting
+            if partition in group.members:
+                duplicates.append(result)
+            else:
+                group.members[partition] = result
+        await self._close_resources(duplicates)
+        for result in subscribed:
+            if isinstance(result, Exception):
+                raise result
+        
+        if missing:
+            logger.info(f"Subscribed {len(missing)} partitions of topic {topic} as {subscription_name} ({len(group)} in group)")
+        return {partition: group.members[partition] for partition in partitions}
+    
+    def _pop_resource(self, pool: ResourcePool, key: Any) -> List[Any]:
+        """Remove a resource from a pool, returning it in a list ready for _close_resources."""
+        resource = pool.pop(key)
+        return [resource] if resource is not None else []
+    
+    async def _subscribe(self, topic: SubscriptionTopic, subscription_name: str,
+                         consumer_type: ConsumerType) -> pulsar.Consumer:
+        """Subscribe a new consumer with the configured initial position and batch receive policy."""
+        # Determine initial position
+        initial_position = (
+            InitialPosition.Earliest 
+            if settings.is_topic_read_from_beginning 
+            else InitialPosition.Latest
+        )
+        
+        batch_receive_policy = pulsar.ConsumerBatchReceivePolicy(
+            settings.batch_receive_max_messages,
+            settings.batch_receive_max_bytes,
+            settings.batch_receive_timeout_ms
+        )
+        
+        return await self._create_resource(
+            self.client.subscribe,
+            topic,
+            subscription_name,
+            consumer_type=consumer_type,
+            initial_position=initial_position,
+            batch_receive_policy=batch_receive_policy,
+            **self._consumer_options()
+        )
+    
+    def _producer_options(self) -> Dict[str, Any]:
+        """Producer options from the configured performance profile."""
+        return {
+            'send_timeout_millis': settings.producer_send_timeout_ms,
+            'batching_enabled': settings.producer_batching_enabled,
+            'batching_max_messages': settings.producer_batching_max_messages,
+            'batching_max_allowed_size_in_bytes': settings.producer_batching_max_bytes,
+            'batching_max_publish_delay_ms': settings.producer_batching_max_publish_delay_ms,
+            'max_pending_messages': settings.producer_max_pending_messages,
+            'block_if_queue_full': settings.producer_block_if_queue_full,
+            'compression_type': getattr(pulsar.CompressionType, settings.producer_compression_type)
+        }
+    
+    def _consumer_options(self) -> Dict[str, Any]:
+        """Consumer prefetch and redelivery options from the configured performance profile."""
+        return {
+            'receiver_queue_size': settings.consumer_receiver_queue_size,
+            'max_total_receiver_queue_size_across_partitions': settings.consumer_max_total_receiver_queue_size_across_partitions,
+            'negative_ack_redelivery_delay_ms': settings.consumer_negative_ack_redelivery_delay_ms
+        }
+    
+    async def _get_reader(self, topic: str,
+                          start_message_id: Optional[pulsar.MessageId] = None) -> Tuple[pulsar.Reader, bool]:
+        """Return the pooled reader for a topic and whether it was just created.
+        
+        A new reader starts at start_message_id, or the earliest message.
+        """
+        await self._close_resources(self.readers.evict_idle())
+        
+        reader = self.readers.get(topic)
+        if reader is not None:
+            return reader, False
+        
+        reader = await self._create_resource(
+            self.client.create_reader,
+            topic,
+            start_message_id or pulsar.MessageId.earliest,
+            receiver_queue_size=settings.reader_receiver_queue_size,
+            start_message_id_inclusive=True
+        )
+        
+        if topic in self.readers:
+            await self._close_resources([reader])
+            return self.readers.get(topic), False
+        
+        await self._close_resources(self.readers.put(topic, reader))
+        logger.info(f"Created reader for topic {topic} ({len(self.readers)} pooled)")
+        return reader, True
+    
+    def _topic_key(self, topic: SubscriptionTopic) -> Any:
+        """Return a hashable pool key for a subscription target; topic order does not matter."""
+        if isinstance(topic, re.Pattern):
+            return ("pattern", topic.pattern)
+        if isinstance(topic, list):
+            return ("topics",) + tuple(sorted(topic))
+        return topic
+    
+    def _resolve_consumer_type(self, subscription_type: Optional[str] = None) -> ConsumerType:
+        """Map a subscription type name to a ConsumerType, falling back to the configured one."""
+        return CONSUMER_TYPES.get(subscription_type or settings.subscription_type, ConsumerType.Shared)
+    
+    async def _close_resources(self, resources: List[Any]):
+        """Close producers or consumers that were evicted from a pool."""
+        for resource in resources:
+            try:
+                await self._run_blocking(resource.close)
+            except Exception as e:
+                logger.warning(f"Error closing pooled {type(resource).__name__}: {e}")
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction metrics for the client resource pools."""
+        return {
+            "producers": self.producers.stats(),
+            "consumers": self.consumers.stats(),
+            "partition_consumers": self.partition_consumers.stats(),
+            "readers": self.readers.stats(),
+            "consume_sessions": self.consume_sessions.stats()
+        }
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction metrics for the in-process caches."""
+        return {
+            "connector_kinds": self.connector_kinds.stats(),
+            "admin_responses": self.admin_cache.stats()
+        }
+    
+    async def consume_messages(self, topic: SubscriptionTopic, subscription_name: str, max_messages: int = 10,
+                               subscription_type: Optional[str] = None, start_position: Optional[str] = None,
+                               start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                               message_filter: Optional[MessageFilter] = None,
+                               scan_budget: Optional[ScanBudget] = None,
+                               payload_format: Optional[PayloadFormat] = None) -> List[Dict[str, Any]]:
+        """Consume messages from a Pulsar topic, a list of topics or a topic pattern.
+        
+        Several topics are multiplexed through one consumer and its receive
+        queue; each message carries the topic it came from. A start position or start_timestamp (ms) seeks the subscription on the
+        broker first; end_timestamp (ms) stops at the first later message.
+        With a message_filter only matching messages are returned, scanning at
+        most what scan_budget allows; scanned non-matching messages are
+        acknowledged as well. payload_format controls how payloads are
+        returned; messages beyond its response budget are not acknowledged.
+        """
+        try:
+            if not self._is_connected:
+                await self.connect()
+            
+            consumer = await self._prepare_consumer(
+                topic, subscription_name, subscription_type, start_position, start_timestamp
+            )
+            
+            if scan_budget:
+                scan_budget.start()
+            
+            # Receive and acknowledge in one executor hop
+            received = await self._run_blocking(
+                self._drain_consumer,
+                consumer,
+                max_messages,
+                self._resolve_consumer_type(subscription_type),
+                end_timestamp,
+                message_filter,
+                scan_budget,
+                payload_format,
+                **self._receive_limits(scan_budget)
+            )
+            
+            messages = [self._message_to_dict(msg, payload_format) for msg in received]
+            
+            logger.info(f"Consumed {len(messages)} messages from topic {describe_topic(topic)}")
+            return messages
+            
+        except Exception as e:
+            logger.error(f"Failed to consume messages from topic {describe_topic(topic)}: {e}")
+            return []
+    
+    async def consume_stream(self, topic: SubscriptionTopic, subscription_name: str,
+                             on_chunk: Callable[[List[Dict[str, Any]], int], Awaitable[None]],
+                             max_messages: int = 10, chunk_size: int = 10,
+                             subscription_type: Optional[str] = None, start_position: Optional[str] = None,
+                             start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                             message_filter: Optional[MessageFilter] = None,
+                             scan_budget: Optional[ScanBudget] = None,
+                             payload_format: Optional[PayloadFormat] = None) -> Dict[str, Any]:
+        """Consume up to max_messages in chunks, awaiting on_chunk(messages, total) for each one.
+        
+        Every chunk is received and acknowledged like a consume_messages call
+        and released once on_chunk returns, so at most chunk_size messages are
+        held at a time. Messages a chunk did not take stay with the consumer
+        for the next one, so chunks arrive in order even when a batch spans
+        several of them. Returns the message and chunk counts with timings.
+        """
+        started = time.monotonic()
+        summary: Dict[str, Any] = {"message_count": 0, "chunks": 0, "first_chunk_ms": None}
+        try:
+            if not self._is_connected:
+                await self.connect()
+            
+            consumer = await self._prepare_consumer(
+                topic, subscription_name, subscription_type, start_position, start_timestamp
+            )
+            consumer_type = self._resolve_consumer_type(subscription_type)
+            
+            if scan_budget:
+                scan_budget.start()
+            
+            while summary["message_count"] < max_messages:
+                wanted = min(chunk_size, max_messages - summary["message_count"])
+                received = await self._run_blocking(
+                    self._drain_consumer,
+                    consumer,
+                    wanted,
+                    consumer_type,
+                    end_timestamp,
+                    message_filter,
+                    scan_budget,
+                    payload_format,
+                    **self._receive_limits(scan_budget)
                 )
+                if received:
+                    summary["message_count"] += len(received)
+                    summary["chunks"] += 1
+                    if summary["first_chunk_ms"] is None:
+                        summary["first_chunk_ms"] = round((time.monotonic() - started) * 1000, 1)
+                    await on_chunk(
+                        [self._message_to_dict(msg, payload_format) for msg in received],
+                        summary["message_count"]
+                    )
                 
-                # Determine initial position
-                initial_position = (
-                    InitialPosition.Earliest 
-                    if settings.is_topic_read_from_beginning 
-                    else InitialPosition.Latest
+                # A short chunk means the topic ran dry, the time window closed or a budget ran out
+                if len(received) < wanted:
+                    break
+            
+            logger.info(f"Streamed {summary['message_count']} messages from topic {describe_topic(topic)} in {summary['chunks']} chunks")
+            
+        except Exception as e:
+            logger.error(f"Failed to stream messages from topic {describe_topic(topic)}: {e}")
+            summary["error"] = str(e) or type(e).__name__
+        
+        summary["elapsed_ms"] = round((time.monotonic() - started) * 1000, 1)
+        return summary
+    
+    async def consume_partitions(self, topic: str, subscription_name: str, max_messages: int = 10,
+                                 subscription_type: Optional[str] = None, start_position: Optional[str] = None,
+                                 start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                                 message_filter: Optional[MessageFilter] = None,
+                                 scan_budget: Optional[ScanBudget] = None,
+                                 payload_format: Optional[PayloadFormat] = None,
+                                 parallelism: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Consume a partitioned topic with one pooled consumer per partition, driven concurrently.
+        
+        max_messages is split across partitions; partitions that fill their
+        share are polled again for whatever others left unused. At most
+        parallelism partitions are received from at once, and the results are
+        merged in publish time order. Non-partitioned topics fall back to
+        consume_messages.
+        """
+        try:
+            if not self._is_connected:
+                await self.connect()
+            
+            partitions = await self._run_blocking(self.client.get_topic_partitions, topic)
+            if len(partitions) <= 1:
+                return await self.consume_messages(
+                    topic, subscription_name, max_messages, subscription_type, start_position,
+                    start_timestamp, end_timestamp, message_filter, scan_budget, payload_format
                 )
-                
-                self.consumer = self.client.subscribe(
-                    topic,
-                    subscription_name,
-                    consumer_type=consumer_type,
-                    initial_position=initial_position
+            
+            seek_target = self._resolve_seek_target(start_position, start_timestamp)
+            consumer_type = self._resolve_consumer_type(subscription_type)
+            parallelism = parallelism or settings.partition_consume_parallelism
+            consumers = await self._get_partition_consumers(
+                topic, partitions, subscription_name, consumer_type, parallelism
+            )
+            if seek_target is not None:
+                sought = await self._gather_bounded(
+                    lambda partition: self._seek_consumer(consumers[partition], seek_target),
+                    partitions,
+                    parallelism
                 )
+                for result in sought:
+                    if isinstance(result, Exception):
+                        raise result
             
-            messages = []
-            for _ in range(max_messages):
-                try:
-                    # Receive message with timeout
-                    msg = self.consumer.receive(timeout_millis=1000)
-                    
-                    message_data = {
-                        'message_id': str(msg.message_id()),
-                        'data': msg.data().decode('utf-8'),
-                        'properties': msg.properties(),
-                        'topic': msg.topic_name(),
-                        'publish_timestamp': msg.publish_timestamp(),
-                        'event_timestamp': msg.event_timestamp()
-                    }
-                    
-                    messages.append(message_data)
-                    
-                    # Acknowledge message
-                    self.consumer.acknowledge(msg)
-                    
-                except pulsar.Timeout:
-                    # No more messages available
+            if scan_budget:
+                scan_budget.start()
+            
+            received: Dict[str, List[pulsar.Message]] = {partition: [] for partition in partitions}
+            active = list(partitions)
+            remaining = max_messages
+            while remaining > 0 and active:
+                # Share what is left evenly; the first partitions get the remainder
+                share, extra = divmod(remaining, len(active))
+                quotas = {partition: share + (i < extra) for i, partition in enumerate(active)}
+                active = [partition for partition in active if quotas[partition] > 0]
+                
+                batches = await self._gather_bounded(
+                    lambda partition: self._run_blocking(
+                        self._drain_consumer,
+                        consumers[partition],
+                        quotas[partition],
+                        consumer_type,
+                        end_timestamp,
+                        message_filter,
+                        scan_budget,
+                        payload_format,
+                        **self._receive_limits(scan_budget)
+                    ),
+                    active,
+                    parallelism
+                )
+                
+                filled = []
+                for partition, batch in zip(active, batches):
+                    if isinstance(batch, Exception):
+                        logger.warning(f"Failed to consume from partition {partition}: {batch}")
+                        continue
+                    received[partition].extend(batch)
+                    remaining -= len(batch)
+                    if len(batch) == quotas[partition]:
+                        filled.append(partition)
+                # Only partitions that filled their share may have more
+                active = filled
+                if (scan_budget and scan_budget.exhausted_reason) or (payload_format and payload_format.exhausted):
                     break
             
-            logger.info(f"Consumed {len(messages)} messages from topic {topic}")
+            # Each partition's messages are mostly ordered already, which keeps this sort close to a merge
+            merged = sorted(
+                (msg for batch in received.values() for msg in batch),
+                key=lambda msg: msg.publish_timestamp()
+            )
+            messages = [self._message_to_dict(msg, payload_format) for msg in merged]
+            
+            logger.info(f"Consumed {len(messages)} messages from {len(partitions)} partitions of topic {topic}")
             return messages
             
         except Exception as e:
-            logger.error(f"Failed to consume messages from topic {topic}: {e}")
+            logger.error(f"Failed to consume partitions of topic {topic}: {e}")
             return []
     
-    async def create_topic(self, topic: str, partitions: int = 1) -> bool:
-        """Create a new topic."""
+    async def open_consume_session(self, topic: SubscriptionTopic, subscription_name: str,
+                                   subscription_type: Optional[str] = None, start_position: Optional[str] = None,
+                                   start_timestamp: Optional[int] = None,
+                                   message_filter: Optional[MessageFilter] = None) -> Optional[str]:
+        """Subscribe a dedicated consumer for paged consumption and return its cursor.
+        
+        Sessions are capped in number and expire when idle; the least recently
+        used one is closed when the cap is reached. Returns None on failure.
+        """
         try:
             if not self._is_connected:
                 await self.connect()
             
-            # Use admin API to create topic
-            import requests
+            await self._close_resources(self.consume_sessions.evict_idle())
+            
+            # Resolve the start before subscribing so an invalid one leaves nothing to clean up
+            seek_target = self._resolve_seek_target(start_position, start_timestamp)
+            consumer_type = self._resolve_consumer_type(subscription_type)
+            consumer = await self._subscribe(topic, subscription_name, consumer_type)
+            
+            if seek_target is not None:
+                try:
+                    await self._run_blocking(consumer.seek, seek_target)
+                except BaseException:
+                    # The session never owned this consumer, so nothing else would close it
+                    await self._close_resources([consumer])
+                    raise
+            
+            cursor = new_cursor()
+            session = ConsumeSession(consumer, describe_topic(topic), subscription_name, consumer_type, message_filter)
+            await self._close_resources(self.consume_sessions.put(cursor, session))
+            logger.info(f"Opened consume session on topic {describe_topic(topic)} as {subscription_name} ({len(self.consume_sessions)} open)")
+            return cursor
+            
+        except Exception as e:
+            logger.error(f"Failed to open consume session on topic {describe_topic(topic)}: {e}")
+            return None
+    
+    async def consume_page(self, cursor: str, page_size: int = 100, scan_budget: Optional[ScanBudget] = None,
+                           payload_format: Optional[PayloadFormat] = None) -> Optional[Dict[str, Any]]:
+        """Receive and acknowledge the next page of a consume session.
+        
+        Returns None if the cursor is unknown or its session expired.
+        """
+        await self._close_resources(self.consume_sessions.evict_idle())
+        
+        session = self.consume_sessions.get(cursor)
+        if session is None:
+            return None
+        
+        try:
+            if scan_budget:
+                scan_budget.start()
+            
+            received = await self._run_blocking(
+                self._drain_consumer,
+                session.consumer,
+                page_size,
+                session.consumer_type,
+                None,
+                session.message_filter,
+                scan_budget,
+                payload_format,
+                **self._receive_limits(scan_budget)
+            )
+            
+            messages = [self._message_to_dict(msg, payload_format) for msg in received]
+            session.delivered += len(messages)
+            session.pages += 1
+            logger.info(f"Consumed page of {len(messages)} messages from topic {session.topic}")
+            return {**session.describe(), "messages": messages}
+            
+        except Exception as e:
+            logger.error(f"Failed to consume page from topic {session.topic}: {e}")
+            return {**session.describe(), "messages": [], "error": str(e) or type(e).__name__}
+    
+    async def close_consume_session(self, cursor: str) -> bool:
+        """Close a consume session's consumer; False if the cursor is unknown."""
+        session = self.consume_sessions.pop(cursor)
+        if session is None:
+            return False
+        await self._close_resources([session])
+        return True
+    
+    async def _prepare_consumer(self, topic: SubscriptionTopic, subscription_name: str, subscription_type: Optional[str] = None,
+                                start_position: Optional[str] = None,
+                                start_timestamp: Optional[int] = None) -> pulsar.Consumer:
+        """Return the pooled consumer, seeking its subscription first if a start is given."""
+        seek_target = self._resolve_seek_target(start_position, start_timestamp)
+        consumer = await self._get_consumer(topic, subscription_name, subscription_type)
+        if seek_target is not None:
+            await self._seek_consumer(consumer, seek_target)
+        return consumer
+    
+    async def _seek_consumer(self, consumer: pulsar.Consumer, seek_target: Any):
+        """Reset the subscription cursor; the client drops its prefetched messages and so do we."""
+        await self._run_blocking(consumer.seek, seek_target)
+        self._discard_pending(consumer)
+    
+    async def peek_messages(self, topic: str, max_messages: int = 10, start_position: Optional[str] = None,
+                            start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None,
+                            message_filter: Optional[MessageFilter] = None,
+                            scan_budget: Optional[ScanBudget] = None,
+                            payload_format: Optional[PayloadFormat] = None) -> List[Dict[str, Any]]:
+        """Read messages with a non-durable reader, without subscribing or acknowledging.
+        
+        The reader is cached per topic, so successive peeks continue where the
+        last one stopped unless a start position ("earliest", "latest" or a
+        message ID) or a publish-time start_timestamp (ms) is given. Readers
+        include their start message, so "latest" returns the last message
+        already published before any newer ones. Reading
+        stops at the first message published after end_timestamp (ms). With a
+        message_filter only matching messages are returned, scanning at most
+        what scan_budget allows. payload_format controls how payloads are
+        returned and stops reading once its response budget is spent.
+        """
+        try:
+            if not self._is_connected:
+                await self.connect()
+            
+            seek_target = self._resolve_seek_target(start_position, start_timestamp)
+            
+            # A fresh reader can start directly at a message ID; timestamps always need a seek
+            initial_id = seek_target if isinstance(seek_target, MESSAGE_ID_TYPES) else None
+            reader, created = await self._get_reader(topic, initial_id)
+            if seek_target is not None and not (created and initial_id is not None):
+                await self._run_blocking(reader.seek, seek_target)
+                self._discard_pending(reader)
+            
+            if scan_budget:
+                scan_budget.start()
+            
+            received = await self._run_blocking(
+                self._read_batch,
+                reader,
+                max_messages,
+                end_timestamp,
+                message_filter,
+                scan_budget,
+                payload_format,
+                **self._receive_limits(scan_budget)
+            )
+            
+            messages = [self._message_to_dict(msg, payload_format) for msg in received]
+            logger.info(f"Peeked {len(messages)} messages from topic {topic}")
+            return messages
+            
+        except Exception as e:
+            logger.error(f"Failed to peek messages from topic {topic}: {e}")
+            return []
+    
+    def _read_batch(self, reader: pulsar.Reader, max_messages: int, end_timestamp: Optional[int] = None,
+                    message_filter: Optional[MessageFilter] = None, scan_budget: Optional[ScanBudget] = None,
+                    payload_format: Optional[PayloadFormat] = None,
+                    deadline: Optional[float] = None) -> List[pulsar.Message]:
+        """Read up to max_messages (matching ones, if filtered) from a reader. Runs on the executor.
+        
+        Like _drain_consumer, messages kept by the previous call are read
+        first, and a message read but not returned because of end_timestamp
+        or the response budget is kept for the next call. The reader has
+        already moved past it, so the next peek would otherwise skip it.
+        Reading stops at the monotonic deadline, returning what was read so
+        far; if the deadline passed anyway, everything read is kept instead.
+        """
+        received = []
+        pending = deque(self._take_pending(reader))
+        while len(received) < max_messages and not (scan_budget and scan_budget.exhausted_reason):
+            if pending:
+                msg = pending.popleft()
+            else:
+                wait_ms = settings.batch_receive_timeout_ms
+                if deadline is not None:
+                    wait_ms = min(wait_ms, int((deadline - time.monotonic()) * 1000))
+                    if wait_ms <= 0:
+                        break
+                try:
+                    msg = reader.read_next(timeout_millis=wait_ms)
+                except pulsar.Timeout:
+                    # No more messages available
+                    break
             
-            url = f"{settings.pulsar_web_service_url}/admin/v2/persistent/public/default/{topic}/partitions"
+            if end_timestamp is not None and msg.publish_timestamp() > end_timestamp:
+                pending.appendleft(msg)
+                break
+            matched = message_filter is None or message_filter.matches(msg)
+            if matched and payload_format and not payload_format.admit(msg):
+                pending.appendleft(msg)
+                break
+            if scan_budget:
+                scan_budget.record(msg)
+            if matched:
+                received.append(msg)
+        
+        if deadline is not None and time.monotonic() > deadline:
+            self._keep_pending(reader, received + list(pending))
+            return []
+        
+        self._keep_pending(reader, list(pending))
+        return received
+    
+    def _receive_limits(self, scan_budget: Optional[ScanBudget] = None) -> Dict[str, float]:
+        """Deadline for a receive loop and the executor timeout that goes with it.
+        
+        The receive time is extended by the scan budget's time limit. The loop
+        itself stops at the monotonic deadline; the executor timeout adds a
+        grace period so the loop's own stop normally comes first.
+        """
+        seconds = settings.pulsar_receive_timeout_seconds
+        if scan_budget:
+            seconds += scan_budget.max_seconds
+        return {
+            "deadline": time.monotonic() + seconds,
+            "timeout": seconds + RECEIVE_DEADLINE_GRACE_SECONDS
+        }
+    
+    def _resolve_seek_target(self, start_position: Optional[str] = None,
+                             start_timestamp: Optional[int] = None) -> Optional[Any]:
+        """Turn a start position or publish timestamp (ms) into a seek target, if any."""
+        if start_timestamp is not None:
+            return int(start_timestamp)
+        if start_position == "earliest":
+            return pulsar.MessageId.earliest
+        if start_position == "latest":
+            return pulsar.MessageId.latest
+        if start_position:
+            return parse_message_id(start_position)
+        return None
+    
+    def _drain_consumer(self, consumer: pulsar.Consumer, max_messages: int, consumer_type: ConsumerType,
+                        end_timestamp: Optional[int] = None, message_filter: Optional[MessageFilter] = None,
+                        scan_budget: Optional[ScanBudget] = None,
+                        payload_format: Optional[PayloadFormat] = None,
+                        deadline: Optional[float] = None) -> List[pulsar.Message]:
+        """Batch-receive up to max_messages and acknowledge them. Runs on the executor.
+        
+        Messages left over by the previous call on this consumer are taken
+        first. Receiving stops at max_messages, at the first message published
+        after end_timestamp (ms) or once a budget is spent; the rest of the
+        batch is kept for the next call rather than negatively acknowledged,
+        so order is preserved and cumulative acks never cover unseen messages.
+        When filtered, every scanned message is acknowledged but only matching
+        ones are returned. No receive wait is started that could end past the
+        monotonic deadline; if the deadline has passed anyway before acking,
+        the caller has given up, so nothing is acknowledged and every message
+        is kept for the next call.
+        """
+        received = []
+        scanned = []
+        leftover: List[pulsar.Message] = []
+        stopped = False
+        while (not stopped and len(received) < max_messages
+               and not (scan_budget and scan_budget.exhausted_reason)
+               and not (payload_format and payload_format.exhausted)):
+            batch = self._take_pending(consumer)
+            if not batch:
+                if deadline is not None and time.monotonic() + settings.batch_receive_timeout_ms / 1000 > deadline:
+                    break
+                try:
+                    # Returns as soon as the policy's count/bytes limit is hit or its wait expires
+                    batch = list(consumer.batch_receive())
+                except pulsar.Timeout:
+                    batch = []
+            
+            if not batch:
+                # No more messages available
+                break
             
+            for index, msg in enumerate(batch):
+                if (len(received) >= max_messages
+                        or (end_timestamp is not None and msg.publish_timestamp() > end_timestamp)
+                        or (scan_budget and scan_budget.exhausted_reason)):
+                    stopped = True
+                else:
+                    matched = message_filter is None or message_filter.matches(msg)
+                    stopped = bool(matched and payload_format and not payload_format.admit(msg))
+                
+                if stopped:
+                    leftover = batch[index:]
+                    break
+                
+                scanned.append(msg)
+                if scan_budget:
+                    scan_budget.record(msg)
+                if matched:
+                    received.append(msg)
+        
+        if deadline is not None and time.monotonic() > deadline:
+            self._keep_pending(consumer, scanned + leftover)
+            return []
+        
+        self._keep_pending(consumer, leftover)
+        self._acknowledge_all(consumer, scanned, consumer_type)
+        return received
+    
+    def _take_pending(self, receiver: Receiver) -> List[pulsar.Message]:
+        """Remove and return the messages kept for a consumer or reader by an earlier receive loop."""
+        with self._pending_lock:
+            pending = self._pending.pop(receiver, None)
+        return list(pending) if pending else []
+    
+    def _keep_pending(self, receiver: Receiver, messages: List[pulsar.Message]):
+        """Keep received but unreturned messages for the next receive loop on the same receiver, in order."""
+        if not messages:
+            return
+        with self._pending_lock:
+            pending = self._pending.setdefault(receiver, deque())
+            pending.extendleft(reversed(messages))
+    
+    def _discard_pending(self, receiver: Receiver):
+        """Forget kept messages, e.g. after a seek moved the receiver elsewhere."""
+        with self._pending_lock:
+            self._pending.pop(receiver, None)
+    
+    def _acknowledge_all(self, consumer: pulsar.Consumer, received: List[pulsar.Message],
+                         consumer_type: ConsumerType):
+        """Acknowledge received messages with as few acknowledge calls as the subscription allows."""
+        if not received:
+            return
+        
+        if consumer_type in (ConsumerType.Exclusive, ConsumerType.Failover):
+            # Cumulative ack covers everything up to the last message of each partition
+            last_per_partition = {}
+            for msg in received:
+                last_per_partition[msg.topic_name()] = msg
+            for msg in last_per_partition.values():
+                consumer.acknowledge_cumulative(msg)
+        else:
+            # Shared subscriptions do not allow cumulative acks
+            for msg in received:
+                consumer.acknowledge(msg)
+    
+    def _message_to_dict(self, msg: pulsar.Message,
+                         payload_format: Optional[PayloadFormat] = None) -> Dict[str, Any]:
+        """Convert a received message to a JSON-serializable dictionary."""
+        payload = (payload_format or PayloadFormat()).payload_fields(msg)
+        return {
+            'message_id': str(msg.message_id()),
+            **payload,
+            'properties': msg.properties(),
+            'topic': msg.topic_name(),
+            'publish_timestamp': msg.publish_timestamp(),
+            'event_timestamp': msg.event_timestamp()
+        }
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared admin HTTP client, creating it lazily."""
+        if self._http_client is None or self._http_client.is_closed:
             headers = {}
             if settings.pulsar_token:
                 headers['Authorization'] = f'Bearer {settings.pulsar_token}'
             
-            response = requests.put(url, json=partitions, headers=headers)
+            # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+            http2 = settings.admin_http2 and importlib.util.find_spec("h2") is not None
+            
+            self._http_client = httpx.AsyncClient(
+                base_url=settings.pulsar_web_service_url,
+                headers=headers,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.admin_max_connections,
+                    max_keepalive_connections=settings.admin_max_keepalive_connections,
+                    keepalive_expiry=settings.admin_keepalive_expiry_seconds
+                ),
+                timeout=httpx.Timeout(
+                    settings.admin_timeout_seconds,
+                    connect=settings.admin_connect_timeout_seconds
+                )
+            )
+        return self._http_client
+    
+    async def _admin_request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request to the Pulsar admin REST API over the pooled HTTP client."""
+        return await self._get_http_client().request(method, path, **kwargs)
+    
+    async def create_topic(self, topic: str, partitions: int = 1) -> bool:
+        """Create a new topic."""
+        try:
+            if not self._is_connected:
+                await self.connect()
+            
+            # Use admin API to create topic
+            path = f"{TOPICS_PATH}/{topic}/partitions"
+            
+            response = await self._admin_request("PUT", path, json=partitions)
             
             if response.status_code in [204, 409]:  # 204: created, 409: already exists
+                self._invalidate_topic(topic)
                 logger.info(f"Topic {topic} created/exists with {partitions} partitions")
                 return True
             else:
@@ -194,17 +1228,12 @@ class PulsarConnector:
     async def delete_topic(self, topic: str) -> bool:
         """Delete a topic."""
         try:
-            import requests
-            
-            url = f"{settings.pulsar_web_service_url}/admin/v2/persistent/public/default/{topic}"
-            
-            headers = {}
-            if settings.pulsar_token:
-                headers['Authorization'] = f'Bearer {settings.pulsar_token}'
+            path = f"{TOPICS_PATH}/{topic}"
             
-            response = requests.delete(url, headers=headers)
+            response = await self._admin_request("DELETE", path)
             
             if response.status_code in [204, 404]:  # 204: deleted, 404: not found
+                self._invalidate_topic(topic)
                 logger.info(f"Topic {topic} deleted or not found")
                 return True
             else:
@@ -218,141 +1247,339 @@ class PulsarConnector:
     async def list_topics(self) -> List[str]:
         """List all topics."""
         try:
-            import requests
-            
-            url = f"{settings.pulsar_web_service_url}/admin/v2/persistent/public/default"
-            
-            headers = {}
-            if settings.pulsar_token:
-                headers['Authorization'] = f'Bearer {settings.pulsar_token}'
-            
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                topics = response.json()
-                logger.info(f"Found {len(topics)} topics")
-                return topics
-            else:
-                logger.error(f"Failed to list topics: {response.text}")
-                return []
+            topics = await self._cached_admin_get(TOPICS_PATH, settings.admin_cache_list_topics_ttl_seconds)
+            logger.info(f"Found {len(topics)} topics")
+            return topics
                 
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to list topics: {e.response.text}")
+            return []
         except Exception as e:
             logger.error(f"Failed to list topics: {e}")
             return []
     
-    async def get_topic_stats(self, topic: str) -> Dict[str, Any]:
-        """Get topic statistics."""
+    async def get_topic_stats(self, topic: str, use_cache: bool = True,
+                              fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get topic statistics, optionally projected down to the given field paths."""
         try:
-            import requests
+            path = f"{TOPICS_PATH}/{topic}/stats"
             
-            url = f"{settings.pulsar_web_service_url}/admin/v2/persistent/public/default/{topic}/stats"
+            stats = await self._cached_admin_get(
+                path,
+                self._topic_stats_ttl(topic),
+                use_cache=use_cache,
+                on_fetch=lambda fetched: self._record_stats_snapshot(topic, fetched)
+            )
+            logger.info(f"Retrieved stats for topic {topic}")
             
-            headers = {}
-            if settings.pulsar_token:
-                headers['Authorization'] = f'Bearer {settings.pulsar_token}'
+            # The cache keeps the full document; only the projection is returned
+            if fields:
+                return project(stats, fields)
+            return stats
+                
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to get topic stats for {topic}: {e.response.text}")
+            return {}
+        except Exception as e:
+            logger.error(f"Failed to get topic stats for {topic}: {e}")
+            return {}
+
+    def _topic_stats_ttl(self, topic: str) -> float:
+        """Cache TTL for a topic's stats; polled topics stay cached between polls."""
+        if topic in settings.stats_poll_topics:
+            return max(settings.admin_cache_topic_stats_ttl_seconds, 2 * settings.stats_poll_interval_seconds)
+        return settings.admin_cache_topic_stats_ttl_seconds
+    
+    def _record_stats_snapshot(self, topic: str, stats: Dict[str, Any]):
+        """Record freshly fetched stats in the topic's snapshot history and time series."""
+        now = time.time()
+        
+        history = self._tracked_stats_entry(
+            self._stats_history, topic, lambda: deque(maxlen=max(2, settings.stats_history_size))
+        )
+        history.append(take_snapshot(stats, now))
+        
+        series = self._tracked_stats_entry(
+            self.stats_series, topic, lambda: TopicSeries(PARTITION_METRICS, settings.stats_series_capacity)
+        )
+        series.append(now, summarize_partition(stats))
+    
+    def _tracked_stats_entry(self, store: "OrderedDict[str, Any]", topic: str, create: Callable[[], Any]) -> Any:
+        """Return the topic's entry in a per-topic stats store, creating it on first use.
+        
+        Polled topics are always kept. Other topics, e.g. every partition of a
+        parallel partitioned-stats fetch, are capped at stats_max_ad_hoc_topics
+        and the least recently recorded one is forgotten first.
+        """
+        entry = store.get(topic)
+        if entry is None:
+            entry = store[topic] = create()
+        store.move_to_end(topic)
+        
+        if len(store) > settings.stats_max_ad_hoc_topics + len(settings.stats_poll_topics):
+            oldest = next((name for name in store if name not in settings.stats_poll_topics), None)
+            if oldest is not None:
+                del store[oldest]
+        return entry
+    
+    def query_topic_series(self, topic: str, metrics: Optional[List[str]] = None,
+                           window_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Summarize recorded stats (min/max/avg/p95) over a trailing window, from memory only."""
+        series = self.stats_series.get(topic)
+        if series is None:
+            return {}
+        
+        unknown = [metric for metric in metrics or [] if metric not in series.values]
+        if unknown:
+            raise ValueError(f"Unknown metrics: {', '.join(unknown)}. Must be among {', '.join(PARTITION_METRICS)}")
+        
+        return {
+            "samples": len(series),
+            "latest_timestamp": series.latest_timestamp(),
+            "window_seconds": window_seconds,
+            "metrics": {
+                metric: series.summarize(metric, window_seconds)
+                for metric in (metrics or PARTITION_METRICS)
+            }
+        }
+    
+    async def get_topic_rates(self, topic: str, window_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Derive backlog growth, lag velocity and drain time from recent stats snapshots.
+        
+        Only fetches new stats when the latest snapshot is older than
+        stats_snapshot_fresh_seconds; otherwise it is answered from memory.
+        """
+        try:
+            history = self._stats_history.get(topic)
+            if not history or time.time() - history[-1]["timestamp"] > settings.stats_snapshot_fresh_seconds:
+                if not await self.get_topic_stats(topic, use_cache=False):
+                    return {}
+                history = self._stats_history.get(topic)
+                if not history:
+                    return {}
             
-            response = requests.get(url, headers=headers)
+            snapshots = list(history)
+            if window_seconds:
+                cutoff = snapshots[-1]["timestamp"] - window_seconds
+                snapshots = [snapshot for snapshot in snapshots if snapshot["timestamp"] >= cutoff]
             
-            if response.status_code == 200:
-                stats = response.json()
-                logger.info(f"Retrieved stats for topic {topic}")
-                return stats
+            return derive_rates(snapshots)
+            
+        except Exception as e:
+            logger.error(f"Failed to derive rates for topic {topic}: {e}")
+            return {}
+    
+    async def get_partitioned_topic_stats(self, topic: str, parallel: bool = False,
+                                          top_n: int = 3) -> Dict[str, Any]:
+        """Get aggregated stats for a partitioned topic.
+        
+        By default a single /partitioned-stats call returns every partition.
+        With parallel=True each partition's /stats is fetched concurrently
+        instead, which also warms the per-partition stats cache.
+        """
+        try:
+            if parallel:
+                metadata = await self._cached_admin_get(
+                    f"{TOPICS_PATH}/{topic}/partitions", settings.admin_cache_list_topics_ttl_seconds
+                )
+                partition_count = metadata.get("partitions", 0)
+                names = [f"{topic}-partition-{i}" for i in range(partition_count)] or [topic]
+                
+                results = await self._gather_bounded(self.get_topic_stats, names)
+                partitions = {
+                    name: stats for name, stats in zip(names, results)
+                    if stats and not isinstance(stats, BaseException)
+                }
+                failed = [name for name in names if name not in partitions]
             else:
-                logger.error(f"Failed to get topic stats for {topic}: {response.text}")
+                stats = await self._cached_admin_get(
+                    f"{TOPICS_PATH}/{topic}/partitioned-stats?perPartition=true",
+                    settings.admin_cache_topic_stats_ttl_seconds
+                )
+                partitions = stats.get("partitions") or {}
+                failed = []
+            
+            if not partitions:
+                logger.error(f"No partition stats available for topic {topic}")
                 return {}
+            
+            logger.info(f"Aggregated stats for {len(partitions)} partitions of topic {topic}")
+            return {
+                **aggregate_partitions(partitions, top_n),
+                "failed_partitions": failed
+            }
                 
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to get partitioned stats for {topic}: {e.response.text}")
+            return {}
         except Exception as e:
-            logger.error(f"Failed to get topic stats for {topic}: {e}")
+            logger.error(f"Failed to get partitioned stats for {topic}: {e}")
             return {}
 
-    async def list_connectors(self, connector_type: str = "source") -> List[str]:
-        """List all connectors of specified type (source or sink)."""
+    async def _cached_admin_get(self, path: str, ttl_seconds: float, use_cache: bool = True,
+                                on_fetch: Optional[Callable[[Any], None]] = None) -> Any:
+        """GET a JSON admin resource through the response cache.
+        
+        Fresh entries are served directly; stale ones are served while a
+        background refresh runs. A ttl of 0 disables caching for the endpoint.
+        on_fetch is called with every freshly fetched value, including
+        background refreshes.
+        Raises httpx.HTTPStatusError on non-200 responses.
+        """
+        if use_cache and ttl_seconds > 0:
+            cached = self.admin_cache.lookup(path)
+            if cached is not None:
+                value, stale = cached
+                if stale:
+                    self._schedule_admin_refresh(path, ttl_seconds, on_fetch)
+                return value
+        
+        return await self._fetch_admin_json(path, ttl_seconds, on_fetch)
+    
+    async def _fetch_admin_json(self, path: str, ttl_seconds: float,
+                                on_fetch: Optional[Callable[[Any], None]] = None) -> Any:
+        """GET a JSON admin resource and store it in the response cache.
+        
+        If the cache was invalidated while the request was in flight, the
+        value may describe a topic that has since been deleted or recreated.
+        It is still returned, but neither cached nor passed to on_fetch.
+        """
+        epoch = self._admin_cache_epoch
+        response = await self._admin_request("GET", path)
+        if response.status_code != 200:
+            raise httpx.HTTPStatusError(
+                f"GET {path} returned {response.status_code}",
+                request=response.request,
+                response=response
+            )
+        
+        value = response.json()
+        if epoch != self._admin_cache_epoch:
+            logger.info(f"Not caching {path}: invalidated while it was fetched")
+            return value
+        if ttl_seconds > 0:
+            self.admin_cache.set(path, value, ttl_seconds)
+        if on_fetch is not None:
+            on_fetch(value)
+        return value
+    
+    def _schedule_admin_refresh(self, path: str, ttl_seconds: float,
+                                on_fetch: Optional[Callable[[Any], None]] = None):
+        """Refresh a stale cache entry in the background, at most once at a time per path."""
+        task = self._refresh_tasks.get(path)
+        if task is not None and not task.done():
+            return
+        
+        async def refresh():
+            try:
+                await self._fetch_admin_json(path, ttl_seconds, on_fetch)
+            except Exception as e:
+                logger.warning(f"Background refresh of {path} failed: {e}")
+            finally:
+                self._refresh_tasks.pop(path, None)
+        
+        self._refresh_tasks[path] = asyncio.create_task(refresh())
+    
+    def _invalidate_topic(self, topic: str):
+        """Drop cached admin responses affected by creating or deleting a topic.
+        
+        Fetches already in flight, including background refreshes, are kept
+        from writing their now outdated results back.
+        """
+        self._admin_cache_epoch += 1
+        for path in (
+            TOPICS_PATH,
+            f"{TOPICS_PATH}/{topic}/stats",
+            f"{TOPICS_PATH}/{topic}/partitions",
+            f"{TOPICS_PATH}/{topic}/partitioned-stats?perPartition=true"
+        ):
+            self.admin_cache.invalidate(path)
+
+    async def list_connectors(self, connector_type: str = "source") -> Dict[str, Any]:
+        """List all connectors of specified type (source or sink).
+        
+        Returns the matching connector names plus the names whose configuration
+        could not be fetched, so callers can report partial results.
+        """
         try:
-            import requests
-            
             if connector_type not in ["source", "sink"]:
                 logger.error(f"Invalid connector type: {connector_type}. Must be 'source' or 'sink'")
-                return []
-            
-            url = f"{settings.pulsar_web_service_url}/admin/v3/functions/public/default"
+                return {"connectors": [], "failed": []}
             
-            headers = {}
-            if settings.pulsar_token:
-                headers['Authorization'] = f'Bearer {settings.pulsar_token}'
+            path = "/admin/v3/functions/public/default"
             
-            response = requests.get(url, headers=headers)
+            response = await self._admin_request("GET", path)
             
             if response.status_code == 200:
                 all_functions = response.json()
-                # Filter for connectors by checking if they have connector-specific properties
-                connectors = []
-                
                 for func_name in all_functions:
-                    func_info = await self.get_connector_config(func_name)
-                    if func_info and self._is_connector(func_info, connector_type):
-                        connectors.append(func_name)
+                    self.connector_kinds.set(func_name, "function")
+                
+                configs, failed = await self._fetch_connector_configs(all_functions)
                 
+                # Filter for connectors by checking if they have connector-specific properties
+                connectors = [
+                    func_name for func_name in all_functions
+                    if func_name in configs and self._is_connector(configs[func_name], connector_type)
+                ]
+                
+                if failed:
+                    logger.warning(f"Could not fetch config for {len(failed)} of {len(all_functions)} functions")
                 logger.info(f"Found {len(connectors)} {connector_type} connectors")
-                return connectors
+                return {"connectors": connectors, "failed": failed}
             else:
                 logger.error(f"Failed to list connectors: {response.text}")
-                return []
+                return {"connectors": [], "failed": []}
                 
         except Exception as e:
             logger.error(f"Failed to list connectors: {e}")
-            return []
+            return {"connectors": [], "failed": []}
+
+    async def _gather_bounded(self, func: Callable[[Any], Awaitable[Any]], items: List[Any],
+                              concurrency: Optional[int] = None) -> List[Any]:
+        """Await func(item) for every item, at most concurrency (admin_fanout_concurrency) at a time.
+        
+        Results are returned in item order; exceptions are returned, not raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.admin_fanout_concurrency))
+        
+        async def run(item: Any) -> Any:
+            async with semaphore:
+                return await func(item)
+        
+        return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+    async def _fetch_connector_configs(self, connector_names: List[str]) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Fetch connector configs concurrently, bounded by admin_fanout_concurrency.
+        
+        Returns the configs keyed by name and the names that could not be fetched.
+        """
+        results = await self._gather_bounded(self.get_connector_config, connector_names)
+        
+        configs = {}
+        failed = []
+        for connector_name, result in zip(connector_names, results):
+            if isinstance(result, BaseException) or not result:
+                failed.append(connector_name)
+            else:
+                configs[connector_name] = result
+        
+        return configs, failed
 
     async def get_connector_status(self, connector_name: str) -> Dict[str, Any]:
         """Get the status of a specific connector."""
         try:
-            import requests
-            
-            # Try to get status as a function first (Pulsar IO connectors are functions)
-            url = f"{settings.pulsar_web_service_url}/admin/v3/functions/public/default/{connector_name}/status"
-            
-            headers = {}
-            if settings.pulsar_token:
-                headers['Authorization'] = f'Bearer {settings.pulsar_token}'
-            
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                status = response.json()
-                logger.info(f"Retrieved status for connector {connector_name}")
-                return {
-                    "connector_name": connector_name,
-                    "status": status,
-                    "type": "function"
-                }
-            else:
-                # Try source connector specific endpoint
-                source_url = f"{settings.pulsar_web_service_url}/admin/v3/sources/public/default/{connector_name}/status"
-                source_response = requests.get(source_url, headers=headers)
-                
-                if source_response.status_code == 200:
-                    status = source_response.json()
-                    logger.info(f"Retrieved source connector status for {connector_name}")
-                    return {
-                        "connector_name": connector_name,
-                        "status": status,
-                        "type": "source"
-                    }
-                
-                # Try sink connector specific endpoint
-                sink_url = f"{settings.pulsar_web_service_url}/admin/v3/sinks/public/default/{connector_name}/status"
-                sink_response = requests.get(sink_url, headers=headers)
-                
-                if sink_response.status_code == 200:
-                    status = sink_response.json()
-                    logger.info(f"Retrieved sink connector status for {connector_name}")
-                    return {
-                        "connector_name": connector_name,
-                        "status": status,
-                        "type": "sink"
-                    }
-                
-                logger.error(f"Failed to get connector status for {connector_name}: Function={response.text}, Source={source_response.text}, Sink={sink_response.text}")
+            resolved = await self._get_connector_resource(connector_name, "/status")
+            if not resolved:
                 return {}
+            
+            kind, status = resolved
+            logger.info(f"Retrieved {kind} status for connector {connector_name}")
+            return {
+                "connector_name": connector_name,
+                "status": status,
+                "type": kind
+            }
                 
         except Exception as e:
             logger.error(f"Failed to get connector status for {connector_name}: {e}")
@@ -361,59 +1588,55 @@ class PulsarConnector:
     async def get_connector_config(self, connector_name: str) -> Dict[str, Any]:
         """Get the configuration of a specific connector."""
         try:
-            import requests
-            
-            # Try to get config as a function first
-            url = f"{settings.pulsar_web_service_url}/admin/v3/functions/public/default/{connector_name}"
-            
-            headers = {}
-            if settings.pulsar_token:
-                headers['Authorization'] = f'Bearer {settings.pulsar_token}'
-            
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                config = response.json()
-                logger.info(f"Retrieved config for connector {connector_name}")
-                return {
-                    "connector_name": connector_name,
-                    "config": config,
-                    "type": "function"
-                }
-            else:
-                # Try source connector specific endpoint
-                source_url = f"{settings.pulsar_web_service_url}/admin/v3/sources/public/default/{connector_name}"
-                source_response = requests.get(source_url, headers=headers)
-                
-                if source_response.status_code == 200:
-                    config = source_response.json()
-                    logger.info(f"Retrieved source connector config for {connector_name}")
-                    return {
-                        "connector_name": connector_name,
-                        "config": config,
-                        "type": "source"
-                    }
-                
-                # Try sink connector specific endpoint
-                sink_url = f"{settings.pulsar_web_service_url}/admin/v3/sinks/public/default/{connector_name}"
-                sink_response = requests.get(sink_url, headers=headers)
-                
-                if sink_response.status_code == 200:
-                    config = sink_response.json()
-                    logger.info(f"Retrieved sink connector config for {connector_name}")
-                    return {
-                        "connector_name": connector_name,
-                        "config": config,
-                        "type": "sink"
-                    }
-                
-                logger.error(f"Failed to get connector config for {connector_name}: Function={response.text}, Source={source_response.text}, Sink={sink_response.text}")
+            resolved = await self._get_connector_resource(connector_name)
+            if not resolved:
                 return {}
+            
+            kind, config = resolved
+            logger.info(f"Retrieved {kind} config for connector {connector_name}")
+            return {
+                "connector_name": connector_name,
+                "config": config,
+                "type": kind
+            }
                 
         except Exception as e:
             logger.error(f"Failed to get connector config for {connector_name}: {e}")
             return {}
 
+    async def _get_connector_resource(self, connector_name: str, suffix: str = "") -> Optional[Tuple[str, Any]]:
+        """Fetch a connector resource from the endpoint matching its kind.
+        
+        A cached kind costs a single request. On a miss the function, source and
+        sink endpoints are probed in parallel and the first match, in that order
+        of precedence, is cached.
+        """
+        kind = self.connector_kinds.get(connector_name)
+        if kind:
+            response = await self._admin_request("GET", f"{CONNECTOR_KIND_PATHS[kind]}/{connector_name}{suffix}")
+            if response.status_code == 200:
+                return kind, response.json()
+            # The connector was removed or recreated as another kind
+            self.connector_kinds.invalidate(connector_name)
+        
+        kinds = list(CONNECTOR_KIND_PATHS)
+        responses = await asyncio.gather(
+            *(self._admin_request("GET", f"{CONNECTOR_KIND_PATHS[k]}/{connector_name}{suffix}") for k in kinds),
+            return_exceptions=True
+        )
+        
+        for kind, response in zip(kinds, responses):
+            if not isinstance(response, BaseException) and response.status_code == 200:
+                self.connector_kinds.set(connector_name, kind)
+                return kind, response.json()
+        
+        failures = ", ".join(
+            f"{k.capitalize()}={r if isinstance(r, BaseException) else r.text}"
+            for k, r in zip(kinds, responses)
+        )
+        logger.error(f"Failed to get connector {connector_name}{suffix}: {failures}")
+        return None
+
     def _is_connector(self, func_info: Dict[str, Any], connector_type: str) -> bool:
         """Helper method to determine if a function is a connector of the specified type."""
         if not func_info or "config" not in func_info:
@@ -441,18 +1664,50 @@ class PulsarConnector:
         
         return False
 
-    async def get_all_connectors(self) -> Dict[str, List[str]]:
-        """Get all connectors organized by type."""
+    async def get_all_connectors(self) -> Dict[str, Any]:
+        """Get all connectors organized by type.
+        
+        Lists functions, sources and sinks in parallel, fetches each function
+        config once and classifies it for both connector types.
+        """
         try:
-            source_connectors = await self.list_connectors("source")
-            sink_connectors = await self.list_connectors("sink")
+            functions, native_sources, native_sinks = await asyncio.gather(
+                self._admin_get_list("/admin/v3/functions/public/default"),
+                self._admin_get_list("/admin/v3/sources/public/default"),
+                self._admin_get_list("/admin/v3/sinks/public/default")
+            )
+            
+            for connector_name in native_sources:
+                self.connector_kinds.set(connector_name, "source")
+            for connector_name in native_sinks:
+                self.connector_kinds.set(connector_name, "sink")
+            # Function names take precedence, matching the probe order
+            for func_name in functions:
+                self.connector_kinds.set(func_name, "function")
+            
+            configs, failed = await self._fetch_connector_configs(functions)
+            
+            source_connectors = list(native_sources)
+            sink_connectors = list(native_sinks)
+            for func_name in functions:
+                func_info = configs.get(func_name)
+                if not func_info:
+                    continue
+                if self._is_connector(func_info, "source") and func_name not in source_connectors:
+                    source_connectors.append(func_name)
+                if self._is_connector(func_info, "sink") and func_name not in sink_connectors:
+                    sink_connectors.append(func_name)
+            
+            if failed:
+                logger.warning(f"Could not fetch config for {len(failed)} of {len(functions)} functions")
             
             return {
                 "source": source_connectors,
                 "sink": sink_connectors,
                 "total_source": len(source_connectors),
                 "total_sink": len(sink_connectors),
-                "total": len(source_connectors) + len(sink_connectors)
+                "total": len(source_connectors) + len(sink_connectors),
+                "failed": failed
             }
         except Exception as e:
             logger.error(f"Failed to get all connectors: {e}")
@@ -461,7 +1716,19 @@ class PulsarConnector:
                 "sink": [],
                 "total_source": 0,
                 "total_sink": 0,
-                "total": 0
+                "total": 0,
+                "failed": []
             }
 
+    async def _admin_get_list(self, path: str) -> List[str]:
+        """GET an admin endpoint that returns a list of names, or an empty list on failure."""
+        try:
+            response = await self._admin_request("GET", path)
+            if response.status_code == 200:
+                return response.json()
+            logger.warning(f"Failed to list {path}: {response.text}")
+        except Exception as e:
+            logger.warning(f"Failed to list {path}: {e}")
+        return []
+
  
\ No newline at end of file
@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+
+class ResourcePool:
+    """Bounded LRU pool of Pulsar client resources with idle-time eviction.
+
+    The pool never closes resources itself: methods that evict entries return
+    them so the caller can close them in whatever way suits the resource.
+    """
+
+    def __init__(self, name: str, max_size: int, idle_timeout_seconds: float):
+        self.name = name
+        self.max_size = max(1, max_size)
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._entries: "OrderedDict[Hashable, List[Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the pooled resource for key, marking it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry[1] = time.monotonic()
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, resource: Any) -> List[Any]:
+        """Add a resource and return whatever had to be evicted to make room."""
+        evicted = []
+        previous = self._entries.pop(key, None)
+        if previous is not None and previous[0] is not resource:
+            evicted.append(previous[0])
+
+        self._entries[key] = [resource, time.monotonic()]
+
+        while len(self._entries) > self.max_size:
+            _, (old_resource, _) = self._entries.popitem(last=False)
+            evicted.append(old_resource)
+            self.evictions += 1
+
+        return evicted
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove a resource from the pool without counting it as an eviction."""
+        entry = self._entries.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def evict_idle(self) -> List[Any]:
+        """Remove and return resources unused for longer than the idle timeout."""
+        if self.idle_timeout_seconds <= 0:
+            return []
+
+        cutoff = time.monotonic() - self.idle_timeout_seconds
+        evicted = []
+        # Entries are kept in LRU order, so the idle ones are at the front
+        while self._entries:
+            key, (resource, last_used) = next(iter(self._entries.items()))
+            if last_used > cutoff:
+                break
+            del self._entries[key]
+            evicted.append(resource)
+            self.evictions += 1
+
+        return evicted
+
+    def drain(self) -> List[Any]:
+        """Remove and return every pooled resource."""
+        resources = [resource for resource, _ in self._entries.values()]
+        self._entries.clear()
+        return resources
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool occupancy and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "idle_timeout_seconds": self.idle_timeout_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResourceGroup:
+    """Resources that are pooled, evicted and closed together as one pool entry.
+
+    Used for the per-partition consumers of a partitioned topic, so an LRU
+    pool can never evict some of them while a call is still using the rest.
+    """
+
+    def __init__(self):
+        self.members: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def close(self):
+        """Close every member; one failing close does not keep the others open."""
+        errors = []
+        for resource in self.members.values():
+            try:
+                resource.close()
+            except Exception as e:
+                errors.append(e)
+        self.members.clear()
+        if errors:
+            raise errors[0]
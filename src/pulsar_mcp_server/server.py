@@ -1,4 +1,5 @@
-import json
+import asyncio
+import contextlib
 from collections.abc import Sequence
 from typing import Any
 import traceback
@@ -7,13 +8,88 @@ import mcp.types as types
 from mcp.server import Server
 from pydantic import ValidationError
 
-from .pulsar_connector import PulsarConnector
+from .encoding import encode_result
+from .message_filter import MessageFilter, ScanBudget
+from .payload_format import PAYLOAD_MODES, PayloadFormat
+from .pulsar_connector import PulsarConnector, describe_topic, subscription_topic
 from .settings import ServerSettings
+from .stats_poller import StatsPoller
 
 app = Server("pulsar-server")
 _pulsar_connector: PulsarConnector
 _server_settings: ServerSettings
 
+# Shared input schema for server-side message filtering
+FILTER_SCHEMA = {
+    "type": "object",
+    "description": "Only return messages matching every given condition",
+    "properties": {
+        "properties": {
+            "type": "object",
+            "description": "Message properties that must have exactly these values",
+            "additionalProperties": {"type": "string"}
+        },
+        "key": {
+            "type": "string",
+            "description": "Partition key the message must have"
+        },
+        "payload_regex": {
+            "type": "string",
+            "description": "Regular expression searched in the UTF-8 payload"
+        },
+        "json_path": {
+            "type": "string",
+            "description": "Dotted path into a JSON payload that must exist, e.g. order.status ('*' matches any key or item)"
+        },
+        "json_value": {
+            "description": "Value the json_path must equal"
+        }
+    }
+}
+
+SCAN_BUDGET_SCHEMA = {
+    "type": "object",
+    "description": "Limits on how much a filtered read may scan (defaults from settings)",
+    "properties": {
+        "max_scanned_messages": {"type": "integer", "minimum": 1},
+        "max_scanned_bytes": {"type": "integer", "minimum": 1},
+        "max_scan_seconds": {"type": "number", "exclusiveMinimum": 0}
+    }
+}
+
+# Shared input properties for subscribing to several topics at once
+MULTI_TOPIC_PROPERTIES = {
+    "topics": {
+        "type": "array",
+        "description": "Consume from all of these topics through one consumer instead of a single topic",
+        "items": {"type": "string"},
+        "minItems": 1
+    },
+    "topic_pattern": {
+        "type": "string",
+        "description": "Consume from every topic whose name matches this regex, e.g. 'orders-.*' (the public/default namespace is assumed without a persistent:// prefix)"
+    }
+}
+
+# Shared input properties controlling how payloads are returned
+PAYLOAD_PROPERTIES = {
+    "payload_mode": {
+        "type": "string",
+        "description": "'full' payloads, payloads 'truncate'd to max_payload_bytes, or 'metadata' only (size and sha256 instead of data). Defaults to PAYLOAD_MODE",
+        "enum": list(PAYLOAD_MODES)
+    },
+    "max_payload_bytes": {
+        "type": "integer",
+        "description": "Bytes of each payload to return in 'truncate' mode",
+        "minimum": 0
+    },
+    "max_response_bytes": {
+        "type": "integer",
+        "description": "Stop receiving once returned payload and property bytes reach this total",
+        "minimum": 1
+    }
+}
+
 
 @app.list_tools()
 async def list_tools() -> list[types.Tool]:
@@ -42,6 +118,49 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["topic", "message"]
             }
         ),
+        types.Tool(
+            name="pulsar_publish_batch",
+            description="Publish a batch of messages to a Pulsar topic in a single call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": "The Pulsar topic to publish to"
+                    },
+                    "messages": {
+                        "type": "array",
+                        "description": "Messages to publish, in order",
+                        "minItems": 1,
+                        "maxItems": 10000,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "message": {
+                                    "type": "string",
+                                    "description": "The message content to publish"
+                                },
+                                "properties": {
+                                    "type": "object",
+                                    "description": "Optional message properties as key-value pairs",
+                                    "additionalProperties": {"type": "string"}
+                                },
+                                "key": {
+                                    "type": "string",
+                                    "description": "Optional partition key"
+                                },
+                                "event_timestamp": {
+                                    "type": "integer",
+                                    "description": "Optional event time in milliseconds since epoch"
+                                }
+                            },
+                            "required": ["message"]
+                        }
+                    }
+                },
+                "required": ["topic", "messages"]
+            }
+        ),
         types.Tool(
             name="pulsar_consume",
             description="Consume messages from a Pulsar topic",
@@ -50,21 +169,149 @@ async def list_tools() -> list[types.Tool]:
                 "properties": {
                     "topic": {
                         "type": "string",
-                        "description": "The Pulsar topic to consume from"
+                        "description": "The Pulsar topic to consume from (required unless topics or topic_pattern is given)"
                     },
+                    **MULTI_TOPIC_PROPERTIES,
                     "subscription_name": {
                         "type": "string",
                         "description": "The subscription name for consuming messages"
                     },
+                    "subscription_type": {
+                        "type": "string",
+                        "description": "Subscription type (defaults to the configured SUBSCRIPTION_TYPE)",
+                        "enum": ["Exclusive", "Shared", "Failover", "KeyShared"]
+                    },
                     "max_messages": {
                         "type": "integer",
                         "description": "Maximum number of messages to consume",
                         "default": 10,
                         "minimum": 1,
                         "maximum": 100
+                    },
+                    "start_position": {
+                        "type": "string",
+                        "description": "Seek the subscription before consuming: 'earliest', 'latest' or a message ID such as '(123,45,-1,-1)'"
+                    },
+                    "start_timestamp": {
+                        "type": "integer",
+                        "description": "Seek the subscription to the first message published at or after this time (milliseconds since epoch)"
+                    },
+                    "end_timestamp": {
+                        "type": "integer",
+                        "description": "Stop at the first message published after this time (milliseconds since epoch)"
+                    },
+                    "filter": FILTER_SCHEMA,
+                    "scan_budget": SCAN_BUDGET_SCHEMA,
+                    **PAYLOAD_PROPERTIES,
+                    "stream": {
+                        "type": "boolean",
+                        "description": "Send messages in chunks as notifications while they arrive; the result is only a summary",
+                        "default": False
+                    },
+                    "chunk_size": {
+                        "type": "integer",
+                        "description": "Messages per streamed chunk (defaults to STREAM_CHUNK_SIZE)",
+                        "minimum": 1,
+                        "maximum": 100
+                    },
+                    "partition_parallel": {
+                        "type": "boolean",
+                        "description": "For a partitioned topic, receive from a consumer per partition concurrently and merge by publish time",
+                        "default": False
+                    },
+                    "parallelism": {
+                        "type": "integer",
+                        "description": "Partitions received from at once in partition_parallel mode (defaults to PARTITION_CONSUME_PARALLELISM)",
+                        "minimum": 1
+                    }
+                },
+                "required": ["subscription_name"]
+            }
+        ),
+        types.Tool(
+            name="pulsar_consume_page",
+            description="Consume a topic page by page: the first call opens a server-side session and returns a cursor that later calls pass to fetch the next page",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "cursor": {
+                        "type": "string",
+                        "description": "Cursor returned by a previous call; omit to open a new session"
+                    },
+                    "topic": {
+                        "type": "string",
+                        "description": "The Pulsar topic to consume from (new sessions only)"
+                    },
+                    **MULTI_TOPIC_PROPERTIES,
+                    "subscription_name": {
+                        "type": "string",
+                        "description": "The subscription name (new sessions only)"
+                    },
+                    "subscription_type": {
+                        "type": "string",
+                        "description": "Subscription type for a new session (defaults to the configured SUBSCRIPTION_TYPE)",
+                        "enum": ["Exclusive", "Shared", "Failover", "KeyShared"]
+                    },
+                    "start_position": {
+                        "type": "string",
+                        "description": "Seek a new session's subscription first: 'earliest', 'latest' or a message ID such as '(123,45,-1,-1)'"
+                    },
+                    "start_timestamp": {
+                        "type": "integer",
+                        "description": "Seek a new session's subscription to this publish time first (milliseconds since epoch)"
+                    },
+                    "filter": FILTER_SCHEMA,
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Maximum number of messages in this page",
+                        "default": 100,
+                        "minimum": 1,
+                        "maximum": 1000
+                    },
+                    "scan_budget": SCAN_BUDGET_SCHEMA,
+                    **PAYLOAD_PROPERTIES,
+                    "close": {
+                        "type": "boolean",
+                        "description": "Close the cursor's session instead of fetching a page",
+                        "default": False
                     }
+                }
+            }
+        ),
+        types.Tool(
+            name="pulsar_peek",
+            description="Read messages from a Pulsar topic without subscribing or acknowledging them",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": "The Pulsar topic to read from"
+                    },
+                    "max_messages": {
+                        "type": "integer",
+                        "description": "Maximum number of messages to read",
+                        "default": 10,
+                        "minimum": 1,
+                        "maximum": 100
+                    },
+                    "start_position": {
+                        "type": "string",
+                        "description": "Where to start: 'earliest', 'latest' or a message ID such as '(123,45,-1,-1)'. Omit to continue after the previous peek"
+                    },
+                    "start_timestamp": {
+                        "type": "integer",
+                        "description": "Start at the first message published at or after this time (milliseconds since epoch)"
+                    },
+                    "end_timestamp": {
+                        "type": "integer",
+                        "description": "Stop at the first message published after this time (milliseconds since epoch)"
+                    },
+                    "filter": FILTER_SCHEMA,
+                    "scan_budget": SCAN_BUDGET_SCHEMA,
+                    **PAYLOAD_PROPERTIES
                 },
-                "required": ["topic", "subscription_name"]
+                "required": ["topic"]
             }
         ),
         types.Tool(
@@ -119,6 +366,82 @@ async def list_tools() -> list[types.Tool]:
                     "topic": {
                         "type": "string",
                         "description": "Name of the topic to get stats for"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "description": "Optional field paths to return instead of the full stats, e.g. msgRateIn or subscriptions.*.msgBacklog ('*' matches any key or list item)",
+                        "items": {"type": "string"}
+                    }
+                },
+                "required": ["topic"]
+            }
+        ),
+        types.Tool(
+            name="pulsar_partitioned_stats",
+            description="Get aggregated stats for a partitioned topic: totals, skew across partitions and the hottest partitions",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": "Name of the partitioned topic"
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Number of hottest partitions to return",
+                        "default": 3,
+                        "minimum": 0
+                    },
+                    "parallel": {
+                        "type": "boolean",
+                        "description": "Fetch each partition's stats concurrently instead of one partitioned-stats call",
+                        "default": False
+                    }
+                },
+                "required": ["topic"]
+            }
+        ),
+        types.Tool(
+            name="pulsar_topic_rates",
+            description="Get trends for a topic derived from recent stats snapshots: backlog growth, consumer lag velocity and time-to-drain",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": "Name of the topic"
+                    },
+                    "window_seconds": {
+                        "type": "number",
+                        "description": "Only use snapshots from this many seconds before the latest one",
+                        "exclusiveMinimum": 0
+                    }
+                },
+                "required": ["topic"]
+            }
+        ),
+        types.Tool(
+            name="pulsar_stats_query",
+            description="Summarize a topic's recorded stats (min/max/avg/p95) over a time window from memory, without calling the admin API",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": "Name of the topic"
+                    },
+                    "metrics": {
+                        "type": "array",
+                        "description": "Metrics to summarize (default: all)",
+                        "items": {
+                            "type": "string",
+                            "enum": ["msgRateIn", "msgRateOut", "msgThroughputIn", "msgThroughputOut", "storageSize", "backlog"]
+                        }
+                    },
+                    "window_seconds": {
+                        "type": "number",
+                        "description": "Trailing window to summarize (default: all recorded samples)",
+                        "exclusiveMinimum": 0
                     }
                 },
                 "required": ["topic"]
@@ -176,10 +499,69 @@ async def list_tools() -> list[types.Tool]:
                 "properties": {},
                 "additionalProperties": False
             }
+        ),
+        types.Tool(
+            name="pulsar_client_metrics",
+            description="Get pool and cache metrics (hits, misses, evictions) for the Pulsar client",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "additionalProperties": False
+            }
         )
     ]
 
 
+def _build_filter(arguments: dict) -> tuple[MessageFilter | None, ScanBudget | None]:
+    """Build the message filter and its scan budget from tool arguments."""
+    message_filter = MessageFilter.from_dict(arguments.get("filter"))
+    if message_filter is None:
+        return None, None
+    return message_filter, _build_scan_budget(arguments)
+
+
+def _build_scan_budget(arguments: dict) -> ScanBudget:
+    """Build a scan budget from tool arguments, defaulting to the configured limits."""
+    budget = arguments.get("scan_budget") or {}
+    return ScanBudget(
+        budget.get("max_scanned_messages", _server_settings.filter_max_scanned_messages),
+        budget.get("max_scanned_bytes", _server_settings.filter_max_scanned_bytes),
+        budget.get("max_scan_seconds", _server_settings.filter_max_scan_seconds)
+    )
+
+
+def _build_payload_format(arguments: dict) -> PayloadFormat:
+    """Build the payload format and response budget from tool arguments."""
+    max_response_bytes = arguments.get("max_response_bytes", _server_settings.max_response_payload_bytes)
+    return PayloadFormat(
+        arguments.get("payload_mode", _server_settings.payload_mode),
+        arguments.get("max_payload_bytes", _server_settings.payload_truncate_bytes),
+        max_response_bytes or None
+    )
+
+
+def _chunk_sender(topic: str, subscription_name: str, max_messages: int):
+    """Return a callback that sends streamed message chunks to the requesting client.
+    
+    Each chunk goes out as a log notification; when the request carries a
+    progress token, a progress notification follows with the running count.
+    """
+    session = app.request_context.session
+    meta = app.request_context.meta
+    progress_token = meta.progressToken if meta else None
+    
+    async def send_chunk(messages: list[dict], total: int):
+        await session.send_log_message(
+            "info",
+            {"topic": topic, "subscription": subscription_name, "messages": messages},
+            logger="pulsar_consume"
+        )
+        if progress_token is not None:
+            await session.send_progress_notification(progress_token, total, max_messages)
+    
+    return send_chunk
+
+
 @app.call_tool()
 async def call_tool(
     name: str, arguments: Any
@@ -208,29 +590,172 @@ async def call_tool(
             else:
                 result = {"status": "error", "message": f"Failed to publish message to topic '{topic}'"}
 
-        elif name == "pulsar_consume":
+        elif name == "pulsar_publish_batch":
             topic = arguments.get("topic", _server_settings.topic_name)
+            messages = arguments.get("messages") or []
+            
+            if not messages:
+                raise ValueError("At least one message is required")
+            if any(not isinstance(item, dict) or not item.get("message") for item in messages):
+                raise ValueError("Every batch entry requires message content")
+            
+            batch_result = await _pulsar_connector.publish_batch(topic, messages)
+            
+            if batch_result["failed"] == 0:
+                status = "success"
+            elif batch_result["succeeded"] == 0:
+                status = "error"
+            else:
+                status = "partial"
+            
+            result = {"status": status, **batch_result}
+
+        elif name == "pulsar_consume":
+            target = subscription_topic(
+                arguments.get("topic", _server_settings.topic_name),
+                arguments.get("topics"),
+                arguments.get("topic_pattern")
+            )
+            topic = describe_topic(target)
             subscription_name = arguments.get("subscription_name", _server_settings.subscription_name)
             max_messages = arguments.get("max_messages", 10)
+            subscription_type = arguments.get("subscription_type")
+            start_position = arguments.get("start_position")
+            start_timestamp = arguments.get("start_timestamp")
+            end_timestamp = arguments.get("end_timestamp")
+            message_filter, scan_budget = _build_filter(arguments)
+            payload_format = _build_payload_format(arguments)
+            partition_parallel = arguments.get("partition_parallel", False)
             
-            messages = await _pulsar_connector.consume_messages(topic, subscription_name, max_messages)
+            if partition_parallel and (arguments.get("stream", False) or not isinstance(target, str)):
+                raise ValueError("partition_parallel needs a single topic and cannot be combined with stream")
             
-            if messages:
+            if arguments.get("stream", False):
+                chunk_size = arguments.get("chunk_size", _server_settings.stream_chunk_size)
+                send_chunk = _chunk_sender(topic, subscription_name, max_messages)
+                
+                summary = await _pulsar_connector.consume_stream(
+                    target, subscription_name, send_chunk, max_messages, chunk_size,
+                    subscription_type, start_position, start_timestamp, end_timestamp,
+                    message_filter, scan_budget, payload_format
+                )
+                
                 result = {
-                    "status": "success",
+                    "status": "error" if "error" in summary else "success",
                     "topic": topic,
                     "subscription": subscription_name,
-                    "message_count": len(messages),
-                    "messages": messages
+                    "streamed": True,
+                    **summary
                 }
             else:
+                if partition_parallel:
+                    messages = await _pulsar_connector.consume_partitions(
+                        target, subscription_name, max_messages, subscription_type,
+                        start_position, start_timestamp, end_timestamp,
+                        message_filter, scan_budget, payload_format,
+                        arguments.get("parallelism")
+                    )
+                else:
+                    messages = await _pulsar_connector.consume_messages(
+                        target, subscription_name, max_messages, subscription_type,
+                        start_position, start_timestamp, end_timestamp,
+                        message_filter, scan_budget, payload_format
+                    )
+                
+                if messages:
+                    result = {
+                        "status": "success",
+                        "topic": topic,
+                        "subscription": subscription_name,
+                        "message_count": len(messages),
+                        "messages": messages
+                    }
+                else:
+                    result = {
+                        "status": "success",
+                        "topic": topic,
+                        "subscription": subscription_name,
+                        "message_count": 0,
+                        "message": "No messages available"
+                    }
+            
+            if scan_budget:
+                result["scan"] = scan_budget.stats()
+            if payload_format.mode != "full" or payload_format.exhausted:
+                result["payload"] = payload_format.stats()
+
+        elif name == "pulsar_consume_page":
+            cursor = arguments.get("cursor")
+            page_size = min(arguments.get("page_size", 100), _server_settings.consume_page_max_size)
+            
+            if cursor and arguments.get("close", False):
+                closed = await _pulsar_connector.close_consume_session(cursor)
+                if not closed:
+                    raise ValueError("Unknown or expired cursor")
+                result = {"status": "success", "cursor": None, "message": "Session closed"}
+            else:
+                if not cursor:
+                    target = subscription_topic(
+                        arguments.get("topic", _server_settings.topic_name),
+                        arguments.get("topics"),
+                        arguments.get("topic_pattern")
+                    )
+                    topic = describe_topic(target)
+                    subscription_name = arguments.get("subscription_name", _server_settings.subscription_name)
+                    message_filter = MessageFilter.from_dict(arguments.get("filter"))
+                    
+                    cursor = await _pulsar_connector.open_consume_session(
+                        target, subscription_name, arguments.get("subscription_type"),
+                        arguments.get("start_position"), arguments.get("start_timestamp"),
+                        message_filter
+                    )
+                    if cursor is None:
+                        raise ValueError(f"Failed to open a consume session on topic '{topic}'")
+                
+                # The session's filter was fixed when it was opened, so every page gets a budget
+                scan_budget = _build_scan_budget(arguments)
+                payload_format = _build_payload_format(arguments)
+                
+                page = await _pulsar_connector.consume_page(cursor, page_size, scan_budget, payload_format)
+                if page is None:
+                    raise ValueError("Unknown or expired cursor; open a new session without a cursor")
+                
+                messages = page.pop("messages")
                 result = {
-                    "status": "success",
-                    "topic": topic,
-                    "subscription": subscription_name,
-                    "message_count": 0,
-                    "message": "No messages available"
+                    "status": "error" if "error" in page else "success",
+                    "cursor": cursor,
+                    **page,
+                    "message_count": len(messages),
+                    "messages": messages,
+                    "scan": scan_budget.stats()
                 }
+                if payload_format.mode != "full" or payload_format.exhausted:
+                    result["payload"] = payload_format.stats()
+
+        elif name == "pulsar_peek":
+            topic = arguments.get("topic", _server_settings.topic_name)
+            max_messages = arguments.get("max_messages", 10)
+            start_position = arguments.get("start_position")
+            start_timestamp = arguments.get("start_timestamp")
+            end_timestamp = arguments.get("end_timestamp")
+            message_filter, scan_budget = _build_filter(arguments)
+            payload_format = _build_payload_format(arguments)
+            
+            messages = await _pulsar_connector.peek_messages(
+                topic, max_messages, start_position, start_timestamp, end_timestamp,
+                message_filter, scan_budget, payload_format
+            )
+            
+            result = {
+                "status": "success",
+                "topic": topic,
+                "message_count": len(messages),
+                "messages": messages
+            }
+            if scan_budget:
+                result["scan"] = scan_budget.stats()
+            if payload_format.mode != "full" or payload_format.exhausted:
+                result["payload"] = payload_format.stats()
 
         elif name == "pulsar_create_topic":
             topic = arguments.get("topic")
@@ -269,23 +794,75 @@ async def call_tool(
             if not topic:
                 raise ValueError("Topic name is required")
             
-            stats = await _pulsar_connector.get_topic_stats(topic)
+            fields = arguments.get("fields")
+            
+            stats = await _pulsar_connector.get_topic_stats(topic, fields=fields)
             
             if stats:
                 result = {"status": "success", "topic": topic, "stats": stats}
             else:
                 result = {"status": "error", "message": f"Failed to get stats for topic '{topic}'"}
 
+        elif name == "pulsar_partitioned_stats":
+            topic = arguments.get("topic")
+            top_n = arguments.get("top_n", 3)
+            parallel = arguments.get("parallel", False)
+            
+            if not topic:
+                raise ValueError("Topic name is required")
+            
+            stats = await _pulsar_connector.get_partitioned_topic_stats(topic, parallel, top_n)
+            
+            if stats:
+                result = {"status": "success", "topic": topic, **stats}
+            else:
+                result = {"status": "error", "message": f"Failed to get partitioned stats for topic '{topic}'"}
+
+        elif name == "pulsar_topic_rates":
+            topic = arguments.get("topic")
+            window_seconds = arguments.get("window_seconds")
+            
+            if not topic:
+                raise ValueError("Topic name is required")
+            
+            rates = await _pulsar_connector.get_topic_rates(topic, window_seconds)
+            
+            if rates:
+                result = {"status": "success", "topic": topic, "rates": rates}
+            else:
+                result = {"status": "error", "message": f"Failed to get rates for topic '{topic}'"}
+
+        elif name == "pulsar_stats_query":
+            topic = arguments.get("topic")
+            metrics = arguments.get("metrics")
+            window_seconds = arguments.get("window_seconds")
+            
+            if not topic:
+                raise ValueError("Topic name is required")
+            
+            summary = _pulsar_connector.query_topic_series(topic, metrics, window_seconds)
+            
+            if summary:
+                result = {"status": "success", "topic": topic, **summary}
+            else:
+                result = {
+                    "status": "error",
+                    "message": f"No stats recorded for topic '{topic}'. Add it to STATS_POLL_TOPICS or call pulsar_topic_stats first"
+                }
+
         elif name == "pulsar_list_connectors":
             connector_type = arguments.get("connector_type", "source")
             
-            connectors = await _pulsar_connector.list_connectors(connector_type)
+            listing = await _pulsar_connector.list_connectors(connector_type)
+            connectors = listing["connectors"]
             result = {
-                "status": "success", 
+                "status": "partial" if listing["failed"] else "success", 
                 "connector_type": connector_type,
                 "connectors": connectors, 
                 "count": len(connectors)
             }
+            if listing["failed"]:
+                result["failed"] = listing["failed"]
 
         elif name == "pulsar_connector_status":
             connector_name = arguments.get("connector_name")
@@ -315,7 +892,17 @@ async def call_tool(
 
         elif name == "pulsar_all_connectors":
             all_connectors = await _pulsar_connector.get_all_connectors()
-            result = {"status": "success", "connectors": all_connectors}
+            result = {
+                "status": "partial" if all_connectors["failed"] else "success",
+                "connectors": all_connectors
+            }
+
+        elif name == "pulsar_client_metrics":
+            result = {
+                "status": "success",
+                "pools": _pulsar_connector.get_pool_stats(),
+                "caches": _pulsar_connector.get_cache_stats()
+            }
 
         else:
             return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -336,7 +923,12 @@ async def call_tool(
         )
         raise e
 
-    return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+    text = encode_result(
+        result,
+        encoder=_server_settings.response_encoder,
+        compact=_server_settings.response_compact
+    )
+    return [types.TextContent(type="text", text=text)]
 
 
 async def run_stdio(settings: ServerSettings, pulsar_connector: PulsarConnector):
@@ -349,5 +941,17 @@ async def run_stdio(settings: ServerSettings, pulsar_connector: PulsarConnector)
     global _server_settings
     _server_settings = settings
 
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options()) 
\ No newline at end of file
+    poller_task = None
+    if settings.stats_poll_topics:
+        poller = StatsPoller(pulsar_connector, settings.stats_poll_topics, settings.stats_poll_interval_seconds)
+        poller_task = asyncio.create_task(poller.run())
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        if poller_task:
+            poller_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await poller_task
+        await pulsar_connector.disconnect()
\ No newline at end of file
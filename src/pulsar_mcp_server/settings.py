@@ -1,5 +1,33 @@
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional
+
+# Named performance presets; a preset only changes settings not configured explicitly
+PERFORMANCE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "low-latency": {
+        "producer_batching_enabled": False,
+        "producer_batching_max_publish_delay_ms": 1,
+        "consumer_receiver_queue_size": 100,
+        "consumer_negative_ack_redelivery_delay_ms": 1000,
+        "reader_receiver_queue_size": 100,
+        "batch_receive_max_messages": 10,
+        "batch_receive_timeout_ms": 10,
+    },
+    "high-throughput": {
+        "producer_batching_enabled": True,
+        "producer_batching_max_messages": 10000,
+        "producer_batching_max_bytes": 1024 * 1024,
+        "producer_batching_max_publish_delay_ms": 50,
+        "producer_max_pending_messages": 10000,
+        "producer_compression_type": "LZ4",
+        "consumer_receiver_queue_size": 5000,
+        "consumer_max_total_receiver_queue_size_across_partitions": 200000,
+        "reader_receiver_queue_size": 5000,
+        "batch_receive_max_messages": 1000,
+        "batch_receive_timeout_ms": 200,
+        "publish_batch_max_in_flight": 5000,
+    },
+}
 
 
 class ServerSettings(BaseSettings):
@@ -20,10 +48,123 @@ class ServerSettings(BaseSettings):
     pulsar_tls_trust_certs_file_path: Optional[str] = None
     pulsar_tls_allow_insecure_connection: bool = False
     
+    # Admin HTTP client settings
+    admin_http2: bool = True
+    admin_max_connections: int = 20
+    admin_max_keepalive_connections: int = 10
+    admin_keepalive_expiry_seconds: float = 30.0
+    admin_timeout_seconds: float = 30.0
+    admin_connect_timeout_seconds: float = 5.0
+    # Maximum concurrent per-connector lookups when listing connectors
+    admin_fanout_concurrency: int = 16
+    
+    # Cache of resolved connector kinds (function, source or sink)
+    connector_kind_cache_ttl_seconds: float = 300.0
+    connector_kind_cache_max_entries: int = 1024
+    
+    # Admin response cache (a TTL of 0 disables caching for that endpoint)
+    admin_cache_max_entries: int = 512
+    admin_cache_list_topics_ttl_seconds: float = 10.0
+    admin_cache_topic_stats_ttl_seconds: float = 5.0
+    admin_cache_stale_seconds: float = 30.0
+    
+    # Topic stats snapshots kept per topic for rate derivation
+    stats_history_size: int = 120
+    stats_snapshot_fresh_seconds: float = 5.0
+    # Topics outside stats_poll_topics whose snapshots are kept; least recently recorded go first
+    stats_max_ad_hoc_topics: int = 256
+    
+    # Background stats poller (disabled while stats_poll_topics is empty)
+    stats_poll_topics: List[str] = []
+    stats_poll_interval_seconds: float = 10.0
+    stats_series_capacity: int = 360
+    
+    # Executor for blocking pulsar client calls
+    blocking_executor_max_workers: int = 8
+    pulsar_operation_timeout_seconds: float = 30.0
+    pulsar_receive_timeout_seconds: float = 10.0
+    
+    # Producer pool settings
+    producer_pool_max_size: int = 32
+    producer_pool_idle_timeout_seconds: float = 300.0
+    
+    # Consumer pool settings
+    consumer_pool_max_size: int = 16
+    consumer_pool_idle_timeout_seconds: float = 300.0
+    
+    # Reader pool settings (used by pulsar_peek)
+    reader_pool_max_size: int = 16
+    reader_pool_idle_timeout_seconds: float = 300.0
+    reader_receiver_queue_size: int = 1000
+    
+    # Paged consumption (pulsar_consume_page): each session holds a dedicated consumer
+    consume_session_max_count: int = 32
+    consume_session_idle_timeout_seconds: float = 120.0
+    consume_page_max_size: int = 1000
+    
+    # Performance profile: "low-latency" or "high-throughput" presets, or None to use the values below
+    performance_profile: Optional[Literal["low-latency", "high-throughput"]] = None
+    
+    # Producer tuning
+    producer_send_timeout_ms: int = 30000
+    producer_batching_enabled: bool = True
+    producer_batching_max_messages: int = 1000
+    producer_batching_max_bytes: int = 128 * 1024
+    producer_batching_max_publish_delay_ms: int = 10
+    producer_max_pending_messages: int = 1000
+    # Blocks the sending thread when the pending queue is full instead of failing the send
+    producer_block_if_queue_full: bool = False
+    producer_compression_type: Literal["NONE", "LZ4", "ZLib", "ZSTD", "SNAPPY"] = "NONE"
+    
+    # Consumer prefetch and redelivery tuning
+    consumer_receiver_queue_size: int = 1000
+    consumer_max_total_receiver_queue_size_across_partitions: int = 50000
+    consumer_negative_ack_redelivery_delay_ms: int = 60000
+    
+    # Batch receive policy applied to pooled consumers
+    batch_receive_max_messages: int = 100
+    batch_receive_max_bytes: int = 10 * 1024 * 1024
+    batch_receive_timeout_ms: int = 100
+    
+    # Partitions received from concurrently by partition-parallel consume
+    partition_consume_parallelism: int = 8
+    # Partitioned topics (per subscription and type) whose partition consumers are kept
+    partition_consumer_pool_max_size: int = 4
+    
+    # Messages per notification when pulsar_consume streams its results
+    stream_chunk_size: int = 10
+    
+    # Default scan budget for filtered consume/peek
+    filter_max_scanned_messages: int = 10000
+    filter_max_scanned_bytes: int = 64 * 1024 * 1024
+    filter_max_scan_seconds: float = 5.0
+    
+    # Payload handling in consume/peek results: "full", "truncate" or "metadata"
+    payload_mode: Literal["full", "truncate", "metadata"] = "full"
+    payload_truncate_bytes: int = 1024
+    # Payload and property bytes allowed in one result (0 disables the limit)
+    max_response_payload_bytes: int = 4 * 1024 * 1024
+    
+    # Maximum number of unacknowledged sends kept in flight by batch publishing
+    publish_batch_max_in_flight: int = 500
+    
+    # Tool response encoding: "auto" (orjson when installed), "json" or "orjson"
+    response_encoder: Literal["auto", "json", "orjson"] = "auto"
+    response_compact: bool = True
+    
     # Tool descriptions (optional)
     tool_publish_description: str = "Publishes information to the configured Pulsar topic"
     tool_consume_description: str = "Consumes information from the configured Pulsar topic"
     
+    @model_validator(mode="after")
+    def apply_performance_profile(self) -> "ServerSettings":
+        """Fill settings that were not configured explicitly from the selected preset."""
+        if self.performance_profile:
+            for name, value in PERFORMANCE_PROFILES[self.performance_profile].items():
+                if name not in self.model_fields_set:
+                    setattr(self, name, value)
+        return self
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import math
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .pulsar_connector import PulsarConnector
+
+logger = logging.getLogger(__name__)
+
+
+class TopicSeries:
+    """Fixed-size ring of samples for one topic, one array('d') per metric.
+
+    All metrics share a timestamp ring, so a sample costs one slot per metric
+    and no per-sample Python objects are kept.
+    """
+
+    def __init__(self, metrics: Iterable[str], capacity: int):
+        self.capacity = max(1, capacity)
+        self.timestamps = array("d", [0.0]) * self.capacity
+        self.values = {metric: array("d", [0.0]) * self.capacity for metric in metrics}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, sample: Dict[str, float]):
+        """Record one sample; metrics missing from sample are stored as NaN."""
+        self.timestamps[self._next] = timestamp
+        for metric, ring in self.values.items():
+            value = sample.get(metric)
+            ring[self._next] = float(value) if value is not None else math.nan
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def latest_timestamp(self) -> Optional[float]:
+        """Return the timestamp of the newest sample, if any."""
+        if not self._count:
+            return None
+        return self.timestamps[(self._next - 1) % self.capacity]
+
+    def window(self, metric: str, since: float) -> List[float]:
+        """Return the metric's values sampled at or after since, oldest first."""
+        ring = self.values[metric]
+        start = (self._next - self._count) % self.capacity
+        values = []
+        for offset in range(self._count):
+            index = (start + offset) % self.capacity
+            if self.timestamps[index] >= since and not math.isnan(ring[index]):
+                values.append(ring[index])
+        return values
+
+    def summarize(self, metric: str, window_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Return count/min/max/avg/p95/latest of a metric over the trailing window."""
+        latest = self.latest_timestamp()
+        if latest is None:
+            return {"count": 0}
+
+        since = latest - window_seconds if window_seconds else -math.inf
+        values = self.window(metric, since)
+        if not values:
+            return {"count": 0}
+
+        ordered = sorted(values)
+        # Nearest-rank percentile
+        p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+        return {
+            "count": len(values),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "avg": sum(values) / len(values),
+            "p95": p95,
+            "latest": values[-1],
+        }
+
+
+class StatsPoller:
+    """Background task that refreshes stats for a fixed set of topics at an interval.
+
+    Each poll bypasses the admin cache; the connector records the fetched
+    stats into its snapshot history and time series and refreshes the cache.
+    """
+
+    def __init__(self, connector: "PulsarConnector", topics: List[str], interval_seconds: float):
+        self.connector = connector
+        self.topics = list(topics)
+        self.interval_seconds = max(0.1, interval_seconds)
+
+    async def poll_once(self):
+        """Fetch fresh stats for every configured topic concurrently."""
+        await asyncio.gather(
+            *(self.connector.get_topic_stats(topic, use_cache=False) for topic in self.topics),
+            return_exceptions=True
+        )
+
+    async def run(self):
+        """Poll until cancelled, keeping a fixed cadence regardless of poll duration."""
+        logger.info(f"Polling stats for {len(self.topics)} topics every {self.interval_seconds}s")
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.warning(f"Stats poll failed: {e}")
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.interval_seconds - elapsed))
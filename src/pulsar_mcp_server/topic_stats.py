@@ -0,0 +1,131 @@
+import math
+from typing import Any, Dict, List
+
+# Per-partition metrics that are summed into topic totals and compared for skew
+PARTITION_METRICS = (
+    "msgRateIn",
+    "msgRateOut",
+    "msgThroughputIn",
+    "msgThroughputOut",
+    "storageSize",
+    "backlog",
+)
+
+
+def total_backlog(stats: Dict[str, Any]) -> int:
+    """Sum msgBacklog across every subscription of a topic stats document."""
+    return sum(
+        subscription.get("msgBacklog", 0) or 0
+        for subscription in (stats.get("subscriptions") or {}).values()
+    )
+
+
+def summarize_partition(stats: Dict[str, Any]) -> Dict[str, float]:
+    """Extract the metrics used for aggregation from one partition's stats."""
+    summary = {metric: stats.get(metric, 0) or 0 for metric in PARTITION_METRICS if metric != "backlog"}
+    summary["backlog"] = total_backlog(stats)
+    return summary
+
+
+def aggregate_partitions(partitions: Dict[str, Dict[str, Any]], top_n: int = 3) -> Dict[str, Any]:
+    """Aggregate per-partition stats into totals, skew metrics and the hottest partitions.
+
+    Skew is reported per metric as the max/mean ratio and the coefficient of
+    variation (stddev/mean); a perfectly balanced topic has 1.0 and 0.0.
+    Partitions are ranked hottest first by msgRateIn, then msgThroughputIn.
+    """
+    summaries = {name: summarize_partition(stats) for name, stats in partitions.items()}
+    count = len(summaries)
+
+    totals = {metric: sum(s[metric] for s in summaries.values()) for metric in PARTITION_METRICS}
+
+    skew = {}
+    for metric in PARTITION_METRICS:
+        values = [s[metric] for s in summaries.values()]
+        if not values:
+            continue
+        mean = totals[metric] / count
+        stddev = math.sqrt(sum((v - mean) ** 2 for v in values) / count)
+        skew[metric] = {
+            "min": min(values),
+            "max": max(values),
+            "mean": round(mean, 3),
+            "max_to_mean": round(max(values) / mean, 3) if mean else None,
+            "coefficient_of_variation": round(stddev / mean, 3) if mean else None,
+        }
+
+    ranked = sorted(
+        summaries.items(),
+        key=lambda item: (item[1]["msgRateIn"], item[1]["msgThroughputIn"]),
+        reverse=True,
+    )
+    hottest: List[Dict[str, Any]] = [
+        {
+            "partition": name,
+            **summary,
+            "share_of_rate_in": round(summary["msgRateIn"] / totals["msgRateIn"], 3) if totals["msgRateIn"] else None,
+        }
+        for name, summary in ranked[:max(0, top_n)]
+    ]
+
+    return {
+        "partition_count": count,
+        "totals": totals,
+        "skew": skew,
+        "hottest_partitions": hottest,
+        "partitions": summaries,
+    }
+
+
+def take_snapshot(stats: Dict[str, Any], timestamp: float) -> Dict[str, Any]:
+    """Reduce a topic stats document to the counters needed for rate derivation."""
+    return {
+        "timestamp": timestamp,
+        "backlog": total_backlog(stats),
+        "subscription_backlogs": {
+            name: subscription.get("msgBacklog", 0) or 0
+            for name, subscription in (stats.get("subscriptions") or {}).items()
+        },
+        "msgInCounter": stats.get("msgInCounter"),
+        "msgOutCounter": stats.get("msgOutCounter"),
+        "msgRateIn": stats.get("msgRateIn", 0) or 0,
+        "msgRateOut": stats.get("msgRateOut", 0) or 0,
+    }
+
+
+def derive_rates(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Derive trends from the oldest and newest of a list of snapshots.
+
+    Returns backlog growth per second, per-subscription lag velocity, counter
+    based in/out rates and a time-to-drain estimate when the backlog shrinks.
+    """
+    latest = snapshots[-1]
+    result: Dict[str, Any] = {
+        "snapshots": len(snapshots),
+        "latest_timestamp": latest["timestamp"],
+        "backlog": latest["backlog"],
+        "instantaneous_rate_in": latest["msgRateIn"],
+        "instantaneous_rate_out": latest["msgRateOut"],
+    }
+
+    first = snapshots[0]
+    elapsed = latest["timestamp"] - first["timestamp"]
+    if len(snapshots) < 2 or elapsed <= 0:
+        result["window_seconds"] = 0.0
+        return result
+
+    growth = (latest["backlog"] - first["backlog"]) / elapsed
+    result["window_seconds"] = round(elapsed, 3)
+    result["backlog_growth_per_second"] = round(growth, 3)
+    result["time_to_drain_seconds"] = round(latest["backlog"] / -growth, 1) if growth < 0 else None
+
+    result["subscription_lag_velocity"] = {
+        name: round((backlog - first["subscription_backlogs"].get(name, backlog)) / elapsed, 3)
+        for name, backlog in latest["subscription_backlogs"].items()
+    }
+
+    for counter, key in (("msgInCounter", "rate_in"), ("msgOutCounter", "rate_out")):
+        if latest[counter] is not None and first[counter] is not None:
+            result[key] = round((latest[counter] - first[counter]) / elapsed, 3)
+
+    return result
@@ -0,0 +1,30 @@
+import pytest
+
+from pulsar_mcp_server.pulsar_connector import PulsarConnector
+from stubs import FakeClock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time in the modules that expire entries with a manually advanced clock."""
+    from pulsar_mcp_server import cache, message_filter, resource_pool
+
+    fake = FakeClock()
+    for module in (cache, message_filter, resource_pool):
+        monkeypatch.setattr(module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def connector():
+    """A PulsarConnector that counts as connected, without a client.
+
+    Tests swap in fakes for the pooled getters with stubs.returning(). The
+    executors the connector created are shut down afterwards.
+    """
+    connector = PulsarConnector()
+    connector._is_connected = True
+    yield connector
+    for executor in (connector._executor, connector._send_executor):
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,192 @@
+"""Test doubles for pulsar client objects and the monotonic clock."""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import pulsar
+
+
+class FakeClock:
+    """Stand-in for the time module whose monotonic() only moves when advanced."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+def returning(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Return a coroutine function that ignores its arguments and returns value, e.g. for _get_consumer."""
+    async def pooled(*args: Any, **kwargs: Any) -> Any:
+        return value
+    return pooled
+
+
+class FakeMessage:
+    """Minimal pulsar.Message with the accessors the server uses."""
+
+    def __init__(self, index: int = 0, data: bytes = b"", properties: Optional[Dict[str, str]] = None,
+                 key: str = "", publish_timestamp: Optional[int] = None, topic: str = "persistent://public/default/t"):
+        self.index = index
+        self._data = data or str(index).encode()
+        self._properties = properties or {}
+        self._key = key
+        self._publish_timestamp = index if publish_timestamp is None else publish_timestamp
+        self._topic = topic
+
+    def data(self) -> bytes:
+        return self._data
+
+    def properties(self) -> Dict[str, str]:
+        return self._properties
+
+    def partition_key(self) -> str:
+        return self._key
+
+    def publish_timestamp(self) -> int:
+        return self._publish_timestamp
+
+    def event_timestamp(self) -> int:
+        return 0
+
+    def topic_name(self) -> str:
+        return self._topic
+
+    def message_id(self) -> str:
+        return f"({self.index},0,-1,-1)"
+
+    def __repr__(self) -> str:
+        return f"FakeMessage({self.index})"
+
+
+def messages(count: int, start: int = 0, **kwargs) -> List[FakeMessage]:
+    """Return count consecutive messages numbered from start."""
+    return [FakeMessage(i, **kwargs) for i in range(start, start + count)]
+
+
+class FakeConsumer:
+    """pulsar.Consumer over an in-memory queue whose batch_receive returns up to batch_size messages."""
+
+    def __init__(self, queue: List[FakeMessage], batch_size: int = 100):
+        self.queue = list(queue)
+        self.batch_size = batch_size
+        self.acked: List[int] = []
+        self.cumulative_acks: List[int] = []
+        self.nacked: List[int] = []
+        self.seeks: list = []
+        self.closed = False
+
+    def batch_receive(self) -> List[FakeMessage]:
+        if self.closed:
+            raise pulsar.AlreadyClosed()
+        batch, self.queue = self.queue[:self.batch_size], self.queue[self.batch_size:]
+        return batch
+
+    def acknowledge(self, msg: FakeMessage):
+        self.acked.append(msg.index)
+
+    def acknowledge_cumulative(self, msg: FakeMessage):
+        self.cumulative_acks.append(msg.index)
+
+    def negative_acknowledge(self, msg: FakeMessage):
+        self.nacked.append(msg.index)
+
+    def seek(self, target):
+        self.seeks.append(target)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeProducer:
+    """pulsar.Producer whose send_async records the message and reports success right away."""
+
+    def __init__(self):
+        self.sent: list = []
+        self.closed = False
+
+    def send_async(self, content: bytes, callback, **kwargs):
+        self.sent.append((content, kwargs))
+        callback(pulsar.Result.Ok, f"({len(self.sent)},0,-1,-1)")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeReader:
+    """pulsar.Reader over an in-memory queue; read_next raises pulsar.Timeout once it is empty."""
+
+    def __init__(self, queue: Optional[List[FakeMessage]] = None):
+        self.queue = list(queue or [])
+        self.seeks: list = []
+        self.closed = False
+
+    def read_next(self, timeout_millis: Optional[int] = None) -> FakeMessage:
+        if not self.queue:
+            raise pulsar.Timeout()
+        return self.queue.pop(0)
+
+    def seek(self, target):
+        self.seeks.append(target)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    """pulsar.Client that hands out given readers and records what it was asked to create."""
+
+    def __init__(self, readers: Optional[List[FakeReader]] = None, partitions: Optional[List[str]] = None,
+                 backlogs: Optional[Dict[str, List[FakeMessage]]] = None):
+        self.pending_readers = list(readers or [])
+        self.readers: list = []
+        self.partitions = partitions or []
+        self.backlogs = backlogs or {}
+        self.subscriptions: List[FakeConsumer] = []
+        self.subscribed_topics: List[Any] = []
+
+    def subscribe(self, topic, subscription_name: str, **kwargs) -> "FakeConsumer":
+        """Subscribe a consumer that receives the topic's backlog from the start (none for lists and patterns)."""
+        consumer = FakeConsumer(self.backlogs.get(topic, []) if isinstance(topic, str) else [])
+        self.subscriptions.append(consumer)
+        self.subscribed_topics.append(topic)
+        return consumer
+
+    def create_reader(self, topic: str, start_message_id, **kwargs) -> FakeReader:
+        reader = self.pending_readers.pop(0) if self.pending_readers else FakeReader()
+        self.readers.append((start_message_id, reader))
+        return reader
+
+    def get_topic_partitions(self, topic: str) -> List[str]:
+        return self.partitions or [topic]
+
+
+class FakeAdmin:
+    """Admin REST API answering from a path table; install with connector._admin_request = admin.request.
+
+    A route is a JSON body (status 200), a (status, body) tuple or an
+    exception to raise. Paths with a gate wait until its event is set.
+    Unknown paths answer 404. Every request is recorded.
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Any]] = None):
+        self.routes: Dict[str, Any] = dict(routes or {})
+        self.gates: Dict[str, Any] = {}
+        self.requests: List[tuple] = []
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        self.requests.append((method, path))
+        if path in self.gates:
+            await self.gates[path].wait()
+        route = self.routes.get(path, (404, {"reason": "not found"}))
+        if isinstance(route, Exception):
+            raise route
+        status, body = route if isinstance(route, tuple) else (200, route)
+        return httpx.Response(status, json=body)
+
+    def paths(self) -> List[str]:
+        return [path for _, path in self.requests]
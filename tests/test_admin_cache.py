@@ -0,0 +1,73 @@
+import asyncio
+
+from stubs import FakeAdmin
+
+TOPICS = "/admin/v2/persistent/public/default"
+STATS = f"{TOPICS}/t/stats"
+
+
+def test_stale_stats_are_served_while_one_background_refresh_runs(connector, clock):
+    admin = FakeAdmin({STATS: {"msgRateIn": 1}})
+    connector._admin_request = admin.request
+
+    async def scenario():
+        first = await connector.get_topic_stats("t")
+        admin.routes[STATS] = {"msgRateIn": 2}
+        admin.gates[STATS] = gate = asyncio.Event()
+        clock.advance(6)
+        stale = [await connector.get_topic_stats("t") for _ in range(3)]
+        refreshes = list(connector._refresh_tasks.values())
+        gate.set()
+        await asyncio.gather(*refreshes)
+        return first, stale, refreshes, await connector.get_topic_stats("t")
+
+    first, stale, refreshes, fresh = asyncio.run(scenario())
+
+    assert first == {"msgRateIn": 1}
+    assert stale == [{"msgRateIn": 1}] * 3
+    assert len(refreshes) == 1
+    assert admin.paths().count(STATS) == 2
+    assert fresh == {"msgRateIn": 2}
+    # The background refresh recorded its snapshot too
+    assert len(connector._stats_history["t"]) == 2
+
+
+def test_create_and_delete_invalidate_the_topic_list(connector, clock):
+    admin = FakeAdmin({TOPICS: ["a"], f"{TOPICS}/b/partitions": (204, None), f"{TOPICS}/a": (204, None)})
+    connector._admin_request = admin.request
+
+    async def scenario():
+        listed = [await connector.list_topics()]
+        admin.routes[TOPICS] = ["a", "b"]
+        listed.append(await connector.list_topics())
+        await connector.create_topic("b")
+        listed.append(await connector.list_topics())
+        admin.routes[TOPICS] = ["b"]
+        await connector.delete_topic("a")
+        listed.append(await connector.list_topics())
+        return listed
+
+    assert asyncio.run(scenario()) == [["a"], ["a"], ["a", "b"], ["b"]]
+
+
+def test_refresh_finishing_after_delete_is_not_cached(connector, clock):
+    admin = FakeAdmin({STATS: {"msgRateIn": 1}, f"{TOPICS}/t": (204, None)})
+    connector._admin_request = admin.request
+
+    async def scenario():
+        await connector.get_topic_stats("t")
+        admin.gates[STATS] = gate = asyncio.Event()
+        clock.advance(6)
+        await connector.get_topic_stats("t")
+        refreshes = list(connector._refresh_tasks.values())
+        # Let the refresh send its request before the topic is deleted
+        await asyncio.sleep(0)
+        await connector.delete_topic("t")
+        gate.set()
+        await asyncio.gather(*refreshes)
+
+    asyncio.run(scenario())
+
+    assert admin.paths().count(STATS) == 2
+    assert connector.admin_cache.lookup(STATS) is None
+    assert len(connector._stats_history["t"]) == 1
@@ -0,0 +1,84 @@
+from pulsar_mcp_server.cache import TTLCache
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = TTLCache("test", ttl_seconds=10, max_entries=4)
+    cache.set("a", 1)
+
+    clock.advance(10)
+    assert cache.get("a") == 1
+
+    clock.advance(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_respects_recent_use(clock):
+    cache = TTLCache("test", ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_invalidate_and_clear(clock):
+    cache = TTLCache("test", ttl_seconds=60, max_entries=4)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache("test", ttl_seconds=10, max_entries=4)
+    cache.set("short", 1, ttl_seconds=1)
+    cache.set("long", 2)
+
+    clock.advance(2)
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_lookup_serves_stale_entries_within_stale_window(clock):
+    cache = TTLCache("test", ttl_seconds=5, max_entries=4, stale_seconds=30)
+    cache.set("a", "value")
+
+    assert cache.lookup("a") == ("value", False)
+
+    clock.advance(6)
+    assert cache.lookup("a") == ("value", True)
+    # get() never returns stale data, but keeps the entry for lookup()
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+    clock.advance(30)
+    assert cache.lookup("a") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.stale_hits, cache.misses) == (1, 1, 2)
+
+
+def test_stats_hit_rate_counts_stale_hits(clock):
+    cache = TTLCache("test", ttl_seconds=1, max_entries=4, stale_seconds=10)
+    assert cache.stats()["hit_rate"] == 0.0
+
+    cache.set("a", 1)
+    cache.lookup("a")
+    clock.advance(2)
+    cache.lookup("a")
+    cache.lookup("b")
+
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["hit_rate"] == round(2 / 3, 4)
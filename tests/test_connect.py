@@ -0,0 +1,21 @@
+import asyncio
+
+import pulsar
+
+
+def test_concurrent_connects_create_one_client(connector, monkeypatch):
+    created = []
+
+    class FakeClient:
+        def __init__(self, **config):
+            created.append(self)
+
+    monkeypatch.setattr(pulsar, "Client", FakeClient)
+    connector._is_connected = False
+
+    async def connect_many():
+        return await asyncio.gather(*(connector.connect() for _ in range(5)))
+
+    assert asyncio.run(connect_many()) == [True] * 5
+    assert len(created) == 1
+    assert connector.client is created[0]
@@ -0,0 +1,62 @@
+import asyncio
+
+from stubs import FakeAdmin
+
+FUNCTION = "/admin/v3/functions/public/default/c"
+SOURCE = "/admin/v3/sources/public/default/c"
+SINK = "/admin/v3/sinks/public/default/c"
+
+
+def test_cached_kind_costs_one_request(connector):
+    admin = FakeAdmin({SOURCE: {"className": "Src"}})
+    connector._admin_request = admin.request
+
+    first = asyncio.run(connector.get_connector_config("c"))
+    probes = len(admin.requests)
+    second = asyncio.run(connector.get_connector_config("c"))
+
+    assert first["type"] == second["type"] == "source"
+    assert probes == 3
+    assert admin.paths()[probes:] == [SOURCE]
+
+
+def test_non_200_on_cached_kind_invalidates_and_probes_again(connector):
+    admin = FakeAdmin({SOURCE: {"className": "Src"}})
+    connector._admin_request = admin.request
+    asyncio.run(connector.get_connector_config("c"))
+
+    # Recreated as a sink
+    admin.routes = {SINK: {"className": "Snk"}}
+    admin.requests.clear()
+    result = asyncio.run(connector.get_connector_config("c"))
+
+    assert result["type"] == "sink"
+    assert admin.paths()[0] == SOURCE
+    assert sorted(admin.paths()[1:]) == sorted([FUNCTION, SOURCE, SINK])
+    assert connector.connector_kinds.get("c") == "sink"
+
+
+def test_parallel_probe_keeps_function_source_sink_precedence(connector):
+    admin = FakeAdmin({FUNCTION: {"name": "fn"}, SOURCE: {"name": "src"}, SINK: {"name": "snk"}})
+    connector._admin_request = admin.request
+
+    async def slow_function_probe():
+        # The function endpoint answers last but still wins
+        admin.gates[FUNCTION] = gate = asyncio.Event()
+        lookup = asyncio.create_task(connector.get_connector_config("c"))
+        await asyncio.sleep(0.01)
+        gate.set()
+        return await lookup
+
+    assert asyncio.run(slow_function_probe())["type"] == "function"
+
+    admin.routes.pop(FUNCTION)
+    connector.connector_kinds.clear()
+    assert asyncio.run(connector.get_connector_config("c"))["type"] == "source"
+
+
+def test_unknown_connector_is_not_cached(connector):
+    connector._admin_request = FakeAdmin().request
+
+    assert asyncio.run(connector.get_connector_status("c")) == {}
+    assert len(connector.connector_kinds) == 0
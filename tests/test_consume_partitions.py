@@ -0,0 +1,82 @@
+import asyncio
+
+from pulsar_mcp_server.settings import settings
+from stubs import FakeClient, FakeMessage
+
+
+def partition_names(count: int) -> list:
+    return [f"persistent://public/default/t-partition-{i}" for i in range(count)]
+
+
+def interleaved_backlogs(partitions: list, per_partition: int = 100) -> dict:
+    """Partition i holds messages i*1000.. whose publish times interleave with the other partitions."""
+    return {
+        partition: [FakeMessage(i * 1000 + n, publish_timestamp=n * len(partitions) + i) for n in range(per_partition)]
+        for i, partition in enumerate(partitions)
+    }
+
+
+def consume(connector, max_messages: int, subscription_type: str = "Exclusive") -> list:
+    messages = asyncio.run(connector.consume_partitions("t", "sub", max_messages, subscription_type))
+    return [int(msg["data"]) for msg in messages]
+
+
+def test_partitions_continue_where_the_last_call_stopped(connector):
+    partitions = partition_names(4)
+    connector.client = client = FakeClient(partitions=partitions, backlogs=interleaved_backlogs(partitions))
+
+    pages = [consume(connector, 8) for _ in range(3)]
+
+    assert pages[0] == [0, 1000, 2000, 3000, 1, 1001, 2001, 3001]
+    assert pages[1] == [2, 1002, 2002, 3002, 3, 1003, 2003, 3003]
+    assert pages[2] == [4, 1004, 2004, 3004, 5, 1005, 2005, 3005]
+    for i, consumer in enumerate(client.subscriptions):
+        assert consumer.cumulative_acks == [i * 1000 + 1, i * 1000 + 3, i * 1000 + 5]
+        assert consumer.nacked == []
+
+
+def test_more_partitions_than_the_consumer_pool_holds(connector):
+    partitions = partition_names(settings.consumer_pool_max_size + 4)
+    connector.client = client = FakeClient(partitions=partitions, backlogs=interleaved_backlogs(partitions))
+
+    first = consume(connector, len(partitions))
+    second = consume(connector, len(partitions))
+
+    assert sorted(first) == [i * 1000 for i in range(len(partitions))]
+    assert sorted(second) == [i * 1000 + 1 for i in range(len(partitions))]
+    # Every partition was subscribed once and stayed open across both calls
+    assert len(client.subscriptions) == len(partitions)
+    assert not any(consumer.closed for consumer in client.subscriptions)
+    assert connector.get_pool_stats()["partition_consumers"]["size"] == 1
+
+
+def test_exclusive_whole_topic_and_partition_consumers_replace_each_other(connector):
+    partitions = partition_names(2)
+    connector.client = client = FakeClient(partitions=partitions, backlogs=interleaved_backlogs(partitions))
+
+    async def whole_topic_consumer():
+        return await connector._get_consumer("t", "sub", "Exclusive")
+
+    parent = asyncio.run(whole_topic_consumer())
+    consume(connector, 2)
+
+    assert parent.closed
+    assert len(connector.consumers) == 0
+
+    asyncio.run(whole_topic_consumer())
+
+    assert all(consumer.closed for consumer in client.subscriptions[1:3])
+    assert len(connector.partition_consumers) == 0
+
+
+def test_shared_partition_consumers_leave_whole_topic_consumer_alone(connector):
+    partitions = partition_names(2)
+    connector.client = FakeClient(partitions=partitions, backlogs=interleaved_backlogs(partitions))
+
+    async def whole_topic_consumer():
+        return await connector._get_consumer("t", "sub", "Shared")
+
+    parent = asyncio.run(whole_topic_consumer())
+    consume(connector, 2, "Shared")
+
+    assert not parent.closed
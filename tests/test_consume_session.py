@@ -0,0 +1,46 @@
+import asyncio
+
+from stubs import FakeConsumer, messages, returning
+
+
+class FailingSeekConsumer(FakeConsumer):
+    def seek(self, target):
+        raise RuntimeError("seek failed")
+
+
+def test_invalid_start_position_does_not_subscribe(connector):
+    subscribed = []
+
+    async def subscribe(*args):
+        subscribed.append(args)
+        return FakeConsumer([])
+
+    connector._subscribe = subscribe
+
+    assert asyncio.run(connector.open_consume_session("t", "sub", start_position="not-an-id")) is None
+    assert subscribed == []
+
+
+def test_failed_seek_closes_the_consumer(connector):
+    consumer = FailingSeekConsumer([])
+    connector._subscribe = returning(consumer)
+
+    assert asyncio.run(connector.open_consume_session("t", "sub", start_position="earliest")) is None
+    assert consumer.closed
+    assert len(connector.consume_sessions) == 0
+
+
+def test_pages_continue_through_the_session(connector):
+    consumer = FakeConsumer(messages(25))
+    connector._subscribe = returning(consumer)
+
+    async def page_through():
+        cursor = await connector.open_consume_session("t", "sub", "Exclusive")
+        return [await connector.consume_page(cursor, 10) for _ in range(3)]
+
+    pages = asyncio.run(page_through())
+
+    assert [[int(msg["data"]) for msg in page["messages"]] for page in pages] == [
+        list(range(0, 10)), list(range(10, 20)), list(range(20, 25))
+    ]
+    assert consumer.cumulative_acks == [9, 19, 24]
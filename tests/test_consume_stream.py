@@ -0,0 +1,30 @@
+import asyncio
+
+from pulsar_mcp_server.pulsar_connector import PulsarConnector
+from stubs import FakeConsumer, messages, returning
+
+
+def stream(connector: PulsarConnector, max_messages: int, chunk_size: int) -> list:
+    chunks = []
+
+    async def on_chunk(chunk, total):
+        chunks.append([int(msg["data"]) for msg in chunk])
+
+    summary = asyncio.run(connector.consume_stream(
+        "t", "sub", on_chunk, max_messages=max_messages, chunk_size=chunk_size, subscription_type="Exclusive"
+    ))
+    assert "error" not in summary
+    return chunks
+
+
+def test_chunks_arrive_in_order_and_next_stream_continues(connector):
+    consumer = FakeConsumer(messages(100), batch_size=100)
+    connector._get_consumer = returning(consumer)
+
+    first = stream(connector, 35, 10)
+    second = stream(connector, 10, 10)
+
+    assert first == [list(range(0, 10)), list(range(10, 20)), list(range(20, 30)), list(range(30, 35))]
+    assert second == [list(range(35, 45))]
+    assert consumer.cumulative_acks == [9, 19, 29, 34, 44]
+    assert consumer.nacked == []
@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+import pytest
+
+from pulsar_mcp_server.settings import settings
+
+
+class Resource:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_resource_created_after_timeout_is_closed(connector, monkeypatch):
+    monkeypatch.setattr(settings, "pulsar_operation_timeout_seconds", 0.05)
+    created = []
+
+    def slow_factory():
+        time.sleep(0.2)
+        created.append(Resource())
+        return created[-1]
+
+    async def create_and_wait():
+        with pytest.raises(asyncio.TimeoutError):
+            await connector._create_resource(slow_factory)
+        await asyncio.sleep(0.4)
+
+    asyncio.run(create_and_wait())
+    connector._get_executor().shutdown(wait=True)
+
+    assert len(created) == 1
+    assert created[0].closed
+
+
+def test_resource_created_in_time_is_returned_open(connector):
+    resource = asyncio.run(connector._create_resource(Resource))
+
+    assert not resource.closed
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from pulsar import ConsumerType
+
+from pulsar_mcp_server.message_filter import MessageFilter, ScanBudget
+from pulsar_mcp_server.payload_format import PayloadFormat
+from stubs import FakeConsumer, messages, returning
+
+
+def indexes(received) -> list:
+    return [msg.index for msg in received]
+
+
+def test_exclusive_consumes_in_order_without_skipping_or_nacking(connector):
+    consumer = FakeConsumer(messages(200), batch_size=100)
+
+    first = connector._drain_consumer(consumer, 10, ConsumerType.Exclusive)
+    second = connector._drain_consumer(consumer, 10, ConsumerType.Exclusive)
+
+    assert indexes(first) == list(range(10))
+    assert indexes(second) == list(range(10, 20))
+    # Each cumulative ack only covers messages that were returned
+    assert consumer.cumulative_acks == [9, 19]
+    assert consumer.nacked == []
+
+
+def test_shared_acknowledges_exactly_the_returned_messages(connector):
+    consumer = FakeConsumer(messages(30), batch_size=100)
+
+    results = [indexes(connector._drain_consumer(consumer, 10, ConsumerType.Shared)) for _ in range(4)]
+
+    assert results == [list(range(0, 10)), list(range(10, 20)), list(range(20, 30)), []]
+    assert consumer.acked == list(range(30))
+    assert consumer.nacked == []
+
+
+def test_spans_several_batches(connector):
+    consumer = FakeConsumer(messages(50), batch_size=7)
+
+    assert indexes(connector._drain_consumer(consumer, 20, ConsumerType.Shared)) == list(range(20))
+    assert indexes(connector._drain_consumer(consumer, 20, ConsumerType.Shared)) == list(range(20, 40))
+
+
+def test_end_timestamp_keeps_later_messages_for_the_next_call(connector):
+    consumer = FakeConsumer(messages(20))
+
+    assert indexes(connector._drain_consumer(consumer, 100, ConsumerType.Failover, end_timestamp=4)) == [0, 1, 2, 3, 4]
+    assert consumer.cumulative_acks == [4]
+    assert indexes(connector._drain_consumer(consumer, 3, ConsumerType.Failover)) == [5, 6, 7]
+
+
+def test_filter_acknowledges_scanned_and_keeps_rest_when_budget_runs_out(connector):
+    consumer = FakeConsumer(messages(20))
+    even = MessageFilter.from_dict({"payload_regex": "^[0-9]*[02468]$"})
+    budget = ScanBudget(max_messages=6, max_bytes=10_000, max_seconds=60)
+
+    received = connector._drain_consumer(consumer, 10, ConsumerType.Shared, message_filter=even, scan_budget=budget)
+
+    assert indexes(received) == [0, 2, 4]
+    assert consumer.acked == [0, 1, 2, 3, 4, 5]
+    assert budget.exhausted_reason == "max_scanned_messages"
+    assert indexes(connector._drain_consumer(consumer, 2, ConsumerType.Shared)) == [6, 7]
+
+
+def test_response_budget_keeps_unadmitted_messages(connector):
+    consumer = FakeConsumer(messages(10, data=b"x" * 100))
+    payload_format = PayloadFormat("full", max_response_bytes=250)
+
+    received = connector._drain_consumer(consumer, 10, ConsumerType.Exclusive, payload_format=payload_format)
+
+    assert indexes(received) == [0, 1]
+    assert consumer.cumulative_acks == [1]
+    assert indexes(connector._drain_consumer(consumer, 10, ConsumerType.Exclusive)) == list(range(2, 10))
+
+
+def test_seek_discards_kept_messages(connector):
+    consumer = FakeConsumer(messages(20))
+    connector._get_consumer = returning(consumer)
+    connector._drain_consumer(consumer, 5, ConsumerType.Shared)
+
+    asyncio.run(connector._prepare_consumer("t", "sub", start_position="earliest"))
+    consumer.queue = messages(3, start=100)
+
+    assert len(consumer.seeks) == 1
+    assert indexes(connector._drain_consumer(consumer, 5, ConsumerType.Shared)) == [100, 101, 102]
+
+
+class SlowConsumer(FakeConsumer):
+    def __init__(self, queue, delay: float):
+        super().__init__(queue)
+        self.delay = delay
+        self.receives = 0
+
+    def batch_receive(self):
+        self.receives += 1
+        time.sleep(self.delay)
+        return super().batch_receive()
+
+
+def test_past_deadline_acknowledges_nothing_and_keeps_messages(connector):
+    consumer = SlowConsumer(messages(5), delay=0.3)
+
+    assert connector._drain_consumer(consumer, 5, ConsumerType.Exclusive, deadline=time.monotonic() + 0.2) == []
+    assert consumer.cumulative_acks == []
+    assert indexes(connector._drain_consumer(consumer, 5, ConsumerType.Exclusive)) == [0, 1, 2, 3, 4]
+
+
+def test_no_receive_wait_starts_that_would_outlast_the_deadline(connector):
+    consumer = SlowConsumer(messages(5), delay=0)
+
+    assert connector._drain_consumer(consumer, 5, ConsumerType.Shared, deadline=time.monotonic() + 0.001) == []
+    assert consumer.receives == 0
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from pulsar_mcp_server import encoding
+from pulsar_mcp_server.encoding import encode_result
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "(1,2,-1,-1)"
+
+
+RESULT = {"topic": "t", "messages": [{"id": Opaque(), "data": "é"}], "count": 1}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch):
+    """Run once with orjson missing and once with it installed, when it is."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(encoding, "orjson", None)
+    elif encoding.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("encoder", ["auto", "json", "orjson"])
+def test_every_encoder_round_trips_with_str_fallback(backend, encoder):
+    decoded = json.loads(encode_result(RESULT, encoder))
+
+    assert decoded == {"topic": "t", "messages": [{"id": "(1,2,-1,-1)", "data": "é"}], "count": 1}
+
+
+def test_compact_output_has_no_whitespace(backend):
+    text = encode_result({"a": [1, 2]}, compact=True)
+
+    assert text == '{"a":[1,2]}'
+
+
+def test_indented_output_uses_two_spaces(backend):
+    text = encode_result({"a": 1}, compact=False)
+
+    assert text == '{\n  "a": 1\n}'
+
+
+def test_orjson_request_falls_back_to_json_when_missing(monkeypatch):
+    monkeypatch.setattr(encoding, "orjson", None)
+
+    assert encode_result({"a": Opaque()}, "orjson") == '{"a":"(1,2,-1,-1)"}'
+
+
+def test_unknown_encoder_is_rejected():
+    with pytest.raises(ValueError, match="Unknown response encoder"):
+        encode_result({}, "ujson")
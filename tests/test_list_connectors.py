@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+
+from stubs import FakeAdmin
+
+FUNCTIONS = "/admin/v3/functions/public/default"
+
+
+def function_routes(configs: dict) -> dict:
+    routes = {FUNCTIONS: list(configs)}
+    routes.update({f"{FUNCTIONS}/{name}": config for name, config in configs.items()})
+    return routes
+
+
+def test_list_connectors_reports_functions_whose_config_failed(connector):
+    admin = FakeAdmin(function_routes({
+        "kafka-source": {"className": "KafkaSource"},
+        "jdbc-sink": {"className": "JdbcSink"},
+        "broken": {},
+    }))
+    admin.routes[f"{FUNCTIONS}/broken"] = httpx.ConnectError("connection reset")
+    connector._admin_request = admin.request
+
+    result = asyncio.run(connector.list_connectors("source"))
+
+    assert result == {"connectors": ["kafka-source"], "failed": ["broken"]}
+    # Names from the listing are cached as functions, so each config took one request
+    assert admin.paths().count(f"{FUNCTIONS}/kafka-source") == 1
+
+
+def test_list_connectors_rejects_unknown_type(connector):
+    connector._admin_request = FakeAdmin().request
+
+    assert asyncio.run(connector.list_connectors("function")) == {"connectors": [], "failed": []}
+
+
+def test_get_all_connectors_merges_native_and_function_connectors(connector):
+    admin = FakeAdmin(function_routes({
+        "kafka-source": {"className": "KafkaSource"},
+        "jdbc-sink": {"className": "JdbcSink"},
+        "plain": {"className": "Enricher"},
+        "broken": {},
+    }))
+    admin.routes[f"{FUNCTIONS}/broken"] = (500, {"reason": "boom"})
+    admin.routes["/admin/v3/sources/public/default"] = ["native-source", "kafka-source"]
+    admin.routes["/admin/v3/sinks/public/default"] = ["native-sink"]
+    connector._admin_request = admin.request
+
+    result = asyncio.run(connector.get_all_connectors())
+
+    assert result["source"] == ["native-source", "kafka-source"]
+    assert result["sink"] == ["native-sink", "jdbc-sink"]
+    assert (result["total_source"], result["total_sink"], result["total"]) == (2, 2, 4)
+    assert result["failed"] == ["broken"]
+    # Each function config is fetched once for both classifications
+    assert admin.paths().count(f"{FUNCTIONS}/jdbc-sink") == 1
+    assert connector.connector_kinds.get("native-sink") == "sink"
+    # A name listed as both a function and a source resolves to the function, like the probe order
+    assert connector.connector_kinds.get("kafka-source") == "function"
+
+
+def test_get_all_connectors_keeps_native_lists_when_functions_fail(connector):
+    admin = FakeAdmin({"/admin/v3/sinks/public/default": ["native-sink"]})
+    admin.routes[FUNCTIONS] = (503, {"reason": "unavailable"})
+    connector._admin_request = admin.request
+
+    result = asyncio.run(connector.get_all_connectors())
+
+    assert (result["source"], result["sink"], result["failed"]) == ([], ["native-sink"], [])
@@ -0,0 +1,109 @@
+import pytest
+
+from pulsar_mcp_server.message_filter import MessageFilter, ScanBudget
+from stubs import FakeMessage
+
+
+def order(status: str, **kwargs) -> FakeMessage:
+    return FakeMessage(data=f'{{"order": {{"id": 7, "status": "{status}", "note": null}}}}'.encode(), **kwargs)
+
+
+def test_from_dict_without_conditions_returns_none():
+    assert MessageFilter.from_dict(None) is None
+    assert MessageFilter.from_dict({}) is None
+
+
+def test_from_dict_rejects_invalid_regex():
+    with pytest.raises(ValueError, match="payload_regex"):
+        MessageFilter.from_dict({"payload_regex": "("})
+
+
+def test_properties_must_all_match():
+    message_filter = MessageFilter.from_dict({"properties": {"source": "orders", "region": "eu"}})
+
+    assert message_filter.matches(FakeMessage(properties={"source": "orders", "region": "eu", "extra": "x"}))
+    assert not message_filter.matches(FakeMessage(properties={"source": "orders"}))
+    assert not message_filter.matches(FakeMessage(properties={"source": "orders", "region": "us"}))
+
+
+def test_key_must_match():
+    message_filter = MessageFilter.from_dict({"key": "customer-1"})
+
+    assert message_filter.matches(FakeMessage(key="customer-1"))
+    assert not message_filter.matches(FakeMessage(key="customer-2"))
+
+
+def test_payload_regex_is_searched_in_decoded_payload():
+    message_filter = MessageFilter.from_dict({"payload_regex": "status\": \"(paid|shipped)"})
+
+    assert message_filter.matches(order("paid"))
+    assert not message_filter.matches(order("cancelled"))
+    assert not message_filter.matches(FakeMessage(data=b"\xff\xfe"))
+
+
+def test_json_path_must_exist():
+    message_filter = MessageFilter.from_dict({"json_path": "order.status"})
+
+    assert message_filter.matches(order("paid"))
+    assert not message_filter.matches(FakeMessage(data=b'{"order": {}}'))
+    assert not message_filter.matches(FakeMessage(data=b"not json"))
+
+
+def test_json_value_must_equal_path_value():
+    message_filter = MessageFilter.from_dict({"json_path": "order.status", "json_value": "paid"})
+
+    assert message_filter.matches(order("paid"))
+    assert not message_filter.matches(order("cancelled"))
+
+
+def test_json_value_null_is_a_condition():
+    message_filter = MessageFilter.from_dict({"json_path": "order.note", "json_value": None})
+
+    assert message_filter.matches(order("paid"))
+    assert not message_filter.matches(FakeMessage(data=b'{"order": {"note": "gift"}}'))
+
+
+def test_conditions_are_combined():
+    message_filter = MessageFilter.from_dict({
+        "properties": {"source": "orders"},
+        "json_path": "order.status",
+        "json_value": "paid",
+    })
+
+    assert message_filter.matches(order("paid", properties={"source": "orders"}))
+    assert not message_filter.matches(order("paid"))
+    assert not message_filter.matches(order("cancelled", properties={"source": "orders"}))
+
+
+def test_scan_budget_message_limit(clock):
+    budget = ScanBudget(max_messages=2, max_bytes=1000, max_seconds=10)
+    budget.record(FakeMessage(data=b"abc"))
+    assert budget.exhausted_reason is None
+
+    budget.record(FakeMessage(data=b"abc"))
+    assert budget.exhausted_reason == "max_scanned_messages"
+
+
+def test_scan_budget_byte_limit(clock):
+    budget = ScanBudget(max_messages=100, max_bytes=5, max_seconds=10)
+    budget.record(FakeMessage(data=b"abc"))
+    budget.record(FakeMessage(data=b"de"))
+
+    assert budget.exhausted_reason == "max_scanned_bytes"
+
+
+def test_scan_budget_time_limit_counts_from_start(clock):
+    budget = ScanBudget(max_messages=100, max_bytes=1000, max_seconds=5)
+    clock.advance(4)
+    budget.start()
+    clock.advance(4)
+    assert budget.exhausted_reason is None
+
+    clock.advance(1)
+    assert budget.exhausted_reason == "max_scan_seconds"
+    assert budget.stats() == {
+        "scanned_messages": 0,
+        "scanned_bytes": 0,
+        "elapsed_seconds": 5.0,
+        "budget_exhausted": "max_scan_seconds",
+    }
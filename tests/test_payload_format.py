@@ -0,0 +1,71 @@
+import hashlib
+
+import pytest
+
+from pulsar_mcp_server.payload_format import PayloadFormat
+from stubs import FakeMessage
+
+
+def test_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        PayloadFormat("compressed")
+
+
+def test_full_mode_decodes_whole_payload_replacing_invalid_utf8():
+    assert PayloadFormat().payload_fields(FakeMessage(data=b"caf\xc3\xa9 \xff")) == {"data": "café �"}
+
+
+def test_truncate_mode_adds_size_and_hash():
+    data = "é".encode() * 4
+    fields = PayloadFormat("truncate", max_payload_bytes=3).payload_fields(FakeMessage(data=data))
+
+    assert fields == {
+        "size": 8,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        # The cut splits the second character, which is replaced rather than failing
+        "data": "é�",
+        "truncated": True,
+    }
+
+
+def test_truncate_mode_marks_short_payloads_as_complete():
+    fields = PayloadFormat("truncate", max_payload_bytes=10).payload_fields(FakeMessage(data=b"short"))
+
+    assert fields["data"] == "short"
+    assert fields["truncated"] is False
+
+
+def test_metadata_mode_omits_data():
+    fields = PayloadFormat("metadata").payload_fields(FakeMessage(data=b"payload"))
+
+    assert set(fields) == {"size", "sha256"}
+    assert fields["size"] == 7
+
+
+def test_returned_size_counts_properties_and_returned_payload():
+    msg = FakeMessage(data=b"x" * 100, properties={"ab": "cde"})
+
+    assert PayloadFormat("full").returned_size(msg) == 105
+    assert PayloadFormat("truncate", max_payload_bytes=10).returned_size(msg) == 15
+    assert PayloadFormat("metadata").returned_size(msg) == 5
+
+
+def test_admit_stops_at_response_budget_but_always_admits_first_message():
+    payload_format = PayloadFormat("full", max_response_bytes=150)
+
+    assert payload_format.admit(FakeMessage(data=b"x" * 200))
+    assert not payload_format.admit(FakeMessage(data=b"x"))
+    assert payload_format.exhausted
+    assert payload_format.stats() == {
+        "mode": "full",
+        "response_bytes": 200,
+        "max_response_bytes": 150,
+        "budget_exhausted": True,
+    }
+
+
+def test_admit_without_budget_is_unlimited():
+    payload_format = PayloadFormat("full")
+
+    assert all(payload_format.admit(FakeMessage(data=b"x" * 1000)) for _ in range(100))
+    assert payload_format.response_bytes == 100_000
@@ -0,0 +1,65 @@
+import asyncio
+
+import pulsar
+
+from pulsar_mcp_server.payload_format import PayloadFormat
+from stubs import FakeClient, FakeReader, messages
+
+
+def test_fresh_reader_starts_at_earliest_or_latest_without_seeking(connector):
+    for start_position, expected in (("earliest", pulsar.MessageId.earliest), ("latest", pulsar.MessageId.latest)):
+        connector.readers.drain()
+        connector.client = client = FakeClient()
+
+        assert asyncio.run(connector.peek_messages("t", start_position=start_position)) == []
+
+        start_message_id, reader = client.readers[0]
+        assert start_message_id is expected
+        assert reader.seeks == []
+
+
+def test_fresh_reader_starts_at_a_parsed_message_id_without_seeking(connector):
+    connector.client = client = FakeClient()
+
+    asyncio.run(connector.peek_messages("t", start_position="(12,3,-1,-1)"))
+
+    start_message_id, reader = client.readers[0]
+    assert (start_message_id.ledger_id(), start_message_id.entry_id()) == (12, 3)
+    assert reader.seeks == []
+
+
+def test_timestamp_start_seeks_the_reader(connector):
+    connector.client = client = FakeClient()
+
+    asyncio.run(connector.peek_messages("t", start_timestamp=1700000000000))
+
+    assert client.readers[0][1].seeks == [1700000000000]
+
+
+def peeked(connector, **kwargs) -> list:
+    return [msg["publish_timestamp"] for msg in asyncio.run(connector.peek_messages("t", **kwargs))]
+
+
+def test_message_past_end_timestamp_is_shown_by_the_next_peek(connector):
+    connector.client = FakeClient(readers=[FakeReader(messages(10))])
+
+    assert peeked(connector, max_messages=10, end_timestamp=3) == [0, 1, 2, 3]
+    assert peeked(connector, max_messages=3) == [4, 5, 6]
+
+
+def test_seek_drops_messages_kept_from_the_previous_peek(connector):
+    reader = FakeReader(messages(10))
+    connector.client = FakeClient(readers=[reader])
+
+    peeked(connector, max_messages=10, end_timestamp=3)
+    reader.queue = messages(2, start=100)
+
+    assert peeked(connector, start_timestamp=100) == [100, 101]
+    assert reader.seeks == [100]
+
+
+def test_message_over_the_response_budget_is_shown_by_the_next_peek(connector):
+    connector.client = FakeClient(readers=[FakeReader(messages(10, data=b"x" * 100))])
+
+    assert peeked(connector, payload_format=PayloadFormat("full", max_response_bytes=250)) == [0, 1]
+    assert peeked(connector, payload_format=PayloadFormat("full", max_response_bytes=250)) == [2, 3]
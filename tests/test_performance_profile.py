@@ -0,0 +1,55 @@
+import pytest
+from pydantic import ValidationError
+
+from pulsar_mcp_server.settings import PERFORMANCE_PROFILES, ServerSettings
+
+
+def load(**kwargs) -> ServerSettings:
+    return ServerSettings(_env_file=None, **kwargs)
+
+
+def test_no_profile_keeps_defaults():
+    settings = load()
+
+    assert settings.producer_batching_max_messages == 1000
+    assert settings.producer_compression_type == "NONE"
+
+
+@pytest.mark.parametrize("profile", sorted(PERFORMANCE_PROFILES))
+def test_profile_fills_every_preset_value(profile):
+    settings = load(performance_profile=profile)
+
+    for name, value in PERFORMANCE_PROFILES[profile].items():
+        assert getattr(settings, name) == value
+
+
+def test_explicit_env_value_wins_over_preset(monkeypatch):
+    monkeypatch.setenv("PERFORMANCE_PROFILE", "high-throughput")
+    monkeypatch.setenv("PRODUCER_COMPRESSION_TYPE", "ZSTD")
+
+    settings = load()
+
+    assert settings.producer_compression_type == "ZSTD"
+    assert settings.producer_batching_max_messages == 10000
+
+
+def test_explicit_default_value_still_wins(monkeypatch):
+    monkeypatch.setenv("PERFORMANCE_PROFILE", "low-latency")
+    monkeypatch.setenv("PRODUCER_BATCHING_ENABLED", "true")
+
+    settings = load()
+
+    assert settings.producer_batching_enabled is True
+    assert settings.batch_receive_timeout_ms == 10
+
+
+def test_keyword_value_wins_over_preset():
+    settings = load(performance_profile="high-throughput", batch_receive_max_messages=50)
+
+    assert settings.batch_receive_max_messages == 50
+    assert settings.batch_receive_timeout_ms == 200
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValidationError):
+        load(performance_profile="fastest")
@@ -0,0 +1,79 @@
+import copy
+
+from pulsar_mcp_server.projection import parse_paths, project, resolve_path
+
+
+STATS = {
+    "msgRateIn": 10.5,
+    "msgRateOut": 9.0,
+    "publishers": [
+        {"producerName": "p-0", "msgRateIn": 4.0},
+        {"producerName": "p-1", "msgRateIn": 6.5},
+    ],
+    "subscriptions": {
+        "sub-a": {"msgBacklog": 5, "type": "Shared", "consumers": []},
+        "sub-b": {"msgBacklog": 0, "type": "Exclusive", "consumers": []},
+    },
+    "deduplicationStatus": None,
+}
+
+
+def test_parse_paths_builds_selection_tree():
+    assert parse_paths(["$.subscriptions.*.msgBacklog", "msgRateIn"]) == {
+        "subscriptions": {"*": {"msgBacklog": {}}},
+        "msgRateIn": {},
+    }
+
+
+def test_parse_paths_whole_subtree_wins_over_deeper_path():
+    assert parse_paths(["subscriptions", "subscriptions.sub-a.type"]) == {"subscriptions": {}}
+    assert parse_paths(["subscriptions.sub-a.type", "subscriptions"]) == {"subscriptions": {}}
+
+
+def test_project_selects_top_level_and_nested_fields():
+    assert project(STATS, ["msgRateIn", "subscriptions.sub-a.msgBacklog"]) == {
+        "msgRateIn": 10.5,
+        "subscriptions": {"sub-a": {"msgBacklog": 5}},
+    }
+
+
+def test_project_wildcard_over_objects_and_lists():
+    assert project(STATS, ["subscriptions.*.msgBacklog", "publishers.*.producerName"]) == {
+        "subscriptions": {"sub-a": {"msgBacklog": 5}, "sub-b": {"msgBacklog": 0}},
+        "publishers": [{"producerName": "p-0"}, {"producerName": "p-1"}],
+    }
+
+
+def test_project_list_index():
+    assert project(STATS, ["publishers.1.msgRateIn"]) == {"publishers": [{"msgRateIn": 6.5}]}
+
+
+def test_project_merges_wildcard_and_explicit_key_selections():
+    assert project(STATS, ["subscriptions.*.msgBacklog", "subscriptions.sub-a.type"]) == {
+        "subscriptions": {
+            "sub-a": {"msgBacklog": 5, "type": "Shared"},
+            "sub-b": {"msgBacklog": 0},
+        }
+    }
+
+
+def test_project_does_not_mutate_the_document():
+    original = copy.deepcopy(STATS)
+    project(STATS, ["subscriptions.*.msgBacklog", "subscriptions.sub-a.type", "subscriptions.sub-a"])
+    assert STATS == original
+
+
+def test_project_keeps_null_values_and_drops_missing_paths():
+    assert project(STATS, ["deduplicationStatus", "noSuchField"]) == {"deduplicationStatus": None}
+    assert project(STATS, ["noSuchField.child"]) == {}
+
+
+def test_project_without_paths_returns_the_document():
+    assert project(STATS, []) is STATS
+
+
+def test_resolve_path():
+    assert resolve_path(STATS, "subscriptions.*.msgBacklog") == [5, 0]
+    assert resolve_path(STATS, "$.publishers.-1.producerName") == ["p-1"]
+    assert resolve_path(STATS, "publishers.7.producerName") == []
+    assert resolve_path({"a": [1, 2]}, "a.*") == [1, 2]
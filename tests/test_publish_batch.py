@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+import pulsar
+
+from pulsar_mcp_server.settings import settings
+from stubs import FakeProducer, returning
+
+
+def test_bad_entry_fails_alone(connector):
+    producer = FakeProducer()
+    connector._get_producer = returning(producer)
+
+    result = asyncio.run(connector.publish_batch("t", [
+        {"message": "a"},
+        {"message": "b", "event_timestamp": "not-a-number"},
+        {"message": "c", "key": "k", "event_timestamp": "5"},
+    ]))
+
+    assert [r["status"] for r in result["results"]] == ["success", "error", "success"]
+    assert result["succeeded"] == 2
+    assert [content for content, _ in producer.sent] == [b"a", b"c"]
+    assert producer.sent[1][1]["event_timestamp"] == 5
+    assert producer.sent[1][1]["partition_key"] == "k"
+
+
+def test_in_flight_sends_are_capped_by_the_producer_queue(connector, monkeypatch):
+    monkeypatch.setattr(settings, "publish_batch_max_in_flight", 500)
+    monkeypatch.setattr(settings, "producer_max_pending_messages", 3)
+    pending = []
+    peak = []
+
+    class AckLaterProducer:
+        def send_async(self, content, callback, **kwargs):
+            pending.append(callback)
+            peak.append(len(pending))
+            # Acknowledge once the event loop gets a turn
+            asyncio.get_running_loop().call_soon(lambda: pending.pop(0)(pulsar.Result.Ok, "id"))
+
+    connector._get_producer = returning(AckLaterProducer())
+    result = asyncio.run(connector.publish_batch("t", [{"message": str(i)} for i in range(20)]))
+
+    assert result["succeeded"] == 20
+    assert max(peak) == 3
+
+
+def test_blocking_sends_run_off_the_event_loop_in_order(connector, monkeypatch):
+    monkeypatch.setattr(settings, "producer_block_if_queue_full", True)
+    loop_threads = []
+
+    class ThreadRecordingProducer(FakeProducer):
+        def send_async(self, content, callback, **kwargs):
+            loop_threads.append(threading.current_thread().name)
+            super().send_async(content, callback, **kwargs)
+
+    producer = ThreadRecordingProducer()
+    connector._get_producer = returning(producer)
+    result = asyncio.run(connector.publish_batch("t", [{"message": str(i)} for i in range(50)]))
+
+    assert result["succeeded"] == 50
+    assert [content for content, _ in producer.sent] == [str(i).encode() for i in range(50)]
+    assert all(name.startswith("pulsar-send") for name in loop_threads)
@@ -0,0 +1,65 @@
+from pulsar_mcp_server.resource_pool import ResourcePool
+
+
+def test_get_counts_hits_and_misses(clock):
+    pool = ResourcePool("test", max_size=2, idle_timeout_seconds=60)
+    assert pool.get("a") is None
+
+    pool.put("a", "resource-a")
+    assert pool.get("a") == "resource-a"
+    assert "a" in pool
+    assert (pool.hits, pool.misses) == (1, 1)
+
+
+def test_put_evicts_least_recently_used(clock):
+    pool = ResourcePool("test", max_size=2, idle_timeout_seconds=60)
+    pool.put("a", "resource-a")
+    pool.put("b", "resource-b")
+    pool.get("a")
+
+    assert pool.put("c", "resource-c") == ["resource-b"]
+    assert "b" not in pool
+    assert pool.evictions == 1
+
+
+def test_put_returns_replaced_resource(clock):
+    pool = ResourcePool("test", max_size=2, idle_timeout_seconds=60)
+    pool.put("a", "old")
+
+    assert pool.put("a", "new") == ["old"]
+    assert pool.put("a", "new") == []
+    assert pool.get("a") == "new"
+
+
+def test_evict_idle_removes_only_idle_resources(clock):
+    pool = ResourcePool("test", max_size=4, idle_timeout_seconds=10)
+    pool.put("a", "resource-a")
+    pool.put("b", "resource-b")
+
+    clock.advance(6)
+    pool.get("a")
+    clock.advance(5)
+
+    assert pool.evict_idle() == ["resource-b"]
+    assert "a" in pool
+    assert pool.evictions == 1
+
+
+def test_zero_idle_timeout_disables_idle_eviction(clock):
+    pool = ResourcePool("test", max_size=4, idle_timeout_seconds=0)
+    pool.put("a", "resource-a")
+    clock.advance(10_000)
+
+    assert pool.evict_idle() == []
+
+
+def test_pop_and_drain_are_not_evictions(clock):
+    pool = ResourcePool("test", max_size=4, idle_timeout_seconds=60)
+    pool.put("a", "resource-a")
+    pool.put("b", "resource-b")
+
+    assert pool.pop("a") == "resource-a"
+    assert pool.pop("a") is None
+    assert pool.drain() == ["resource-b"]
+    assert len(pool) == 0
+    assert pool.evictions == 0
@@ -0,0 +1,39 @@
+import asyncio
+import contextlib
+
+import mcp.server.stdio
+
+from pulsar_mcp_server import server
+from pulsar_mcp_server.settings import ServerSettings
+from stubs import FakeAdmin
+
+STATS = "/admin/v2/persistent/public/default/polled/stats"
+
+
+def test_shutdown_awaits_poller_and_disconnects(connector, monkeypatch):
+    admin = FakeAdmin({STATS: {"msgRateIn": 1.0}})
+    admin.gates[STATS] = asyncio.Event()
+    connector._admin_request = admin.request
+    tasks = []
+
+    @contextlib.asynccontextmanager
+    async def fake_stdio_server():
+        yield None, None
+
+    async def fake_run(read_stream, write_stream, options):
+        while not admin.requests:
+            await asyncio.sleep(0)
+        tasks.extend(task for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+    monkeypatch.setattr(mcp.server.stdio, "stdio_server", fake_stdio_server)
+    monkeypatch.setattr(server.app, "run", fake_run)
+
+    async def main():
+        await server.run_stdio(ServerSettings(stats_poll_topics=["polled"]), connector)
+        # Checked before asyncio.run cancels whatever is left over
+        return [task.cancelled() for task in tasks]
+
+    assert asyncio.run(main()) == [True] * len(tasks)
+    assert admin.paths() == [STATS]
+    assert tasks
+    assert not connector._is_connected
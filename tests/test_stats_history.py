@@ -0,0 +1,52 @@
+import asyncio
+
+from pulsar_mcp_server.settings import settings
+from stubs import FakeAdmin
+
+TOPICS = "/admin/v2/persistent/public/default"
+
+
+def stats_admin(topics: list) -> FakeAdmin:
+    return FakeAdmin({f"{TOPICS}/{topic}/stats": {"msgRateIn": 1.0} for topic in topics})
+
+
+def fetch_stats(connector, topics: list):
+    async def fetch_all():
+        for topic in topics:
+            await connector.get_topic_stats(topic, use_cache=False)
+
+    asyncio.run(fetch_all())
+
+
+def test_ad_hoc_topics_are_capped_least_recent_first(connector, monkeypatch):
+    monkeypatch.setattr(settings, "stats_max_ad_hoc_topics", 3)
+    topics = [f"t{i}" for i in range(5)]
+    connector._admin_request = stats_admin(topics).request
+
+    fetch_stats(connector, topics[:3])
+    fetch_stats(connector, ["t0", "t3", "t4"])
+
+    assert list(connector._stats_history) == ["t0", "t3", "t4"]
+
+
+def test_polled_topics_are_never_dropped(connector, monkeypatch):
+    monkeypatch.setattr(settings, "stats_max_ad_hoc_topics", 2)
+    monkeypatch.setattr(settings, "stats_poll_topics", ["polled"])
+    topics = ["polled"] + [f"t{i}" for i in range(5)]
+    connector._admin_request = stats_admin(topics).request
+
+    fetch_stats(connector, topics)
+
+    assert list(connector._stats_history) == ["polled", "t3", "t4"]
+
+
+def test_time_series_follow_the_same_cap(connector, monkeypatch):
+    monkeypatch.setattr(settings, "stats_max_ad_hoc_topics", 2)
+    monkeypatch.setattr(settings, "stats_poll_topics", ["polled"])
+    partitions = [f"t-partition-{i}" for i in range(6)]
+    connector._admin_request = stats_admin(["polled"] + partitions).request
+
+    fetch_stats(connector, ["polled"] + partitions)
+
+    assert list(connector.stats_series) == ["polled", "t-partition-4", "t-partition-5"]
+    assert connector.query_topic_series("t-partition-0") == {}
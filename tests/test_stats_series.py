@@ -0,0 +1,50 @@
+import math
+
+from pulsar_mcp_server.stats_poller import TopicSeries
+
+
+def test_empty_series_summarizes_to_zero_count():
+    series = TopicSeries(["msgRateIn"], capacity=4)
+
+    assert len(series) == 0
+    assert series.latest_timestamp() is None
+    assert series.summarize("msgRateIn") == {"count": 0}
+
+
+def test_ring_keeps_only_the_newest_samples():
+    series = TopicSeries(["msgRateIn"], capacity=3)
+    for t in range(5):
+        series.append(float(t), {"msgRateIn": t * 10})
+
+    assert len(series) == 3
+    assert series.latest_timestamp() == 4.0
+    assert series.window("msgRateIn", -math.inf) == [20.0, 30.0, 40.0]
+
+
+def test_missing_metrics_are_skipped():
+    series = TopicSeries(["msgRateIn", "backlog"], capacity=4)
+    series.append(1.0, {"msgRateIn": 5})
+    series.append(2.0, {"msgRateIn": 6, "backlog": 3})
+
+    assert series.window("backlog", -math.inf) == [3.0]
+    assert series.summarize("backlog")["count"] == 1
+
+
+def test_summarize_uses_trailing_window():
+    series = TopicSeries(["msgRateIn"], capacity=10)
+    for t in range(10):
+        series.append(float(t), {"msgRateIn": t})
+
+    summary = series.summarize("msgRateIn", window_seconds=3)
+
+    assert summary == {"count": 4, "min": 6.0, "max": 9.0, "avg": 7.5, "p95": 9.0, "latest": 9.0}
+
+
+def test_p95_is_nearest_rank():
+    series = TopicSeries(["msgRateIn"], capacity=20)
+    for t in range(20):
+        series.append(float(t), {"msgRateIn": 20 - t})
+
+    # 95% of 20 samples is rank 19 of the sorted values 1..20
+    assert series.summarize("msgRateIn")["p95"] == 19.0
+    assert series.summarize("msgRateIn")["latest"] == 1.0
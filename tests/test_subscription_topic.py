@@ -0,0 +1,64 @@
+import asyncio
+import re
+
+import pytest
+
+from pulsar_mcp_server.pulsar_connector import describe_topic, subscription_topic
+from stubs import FakeClient
+
+
+def test_pattern_without_scheme_is_qualified_to_default_namespace():
+    target = subscription_topic(topic="t", topic_pattern="orders-.*")
+
+    assert isinstance(target, re.Pattern)
+    assert target.pattern == "persistent://public/default/orders-.*"
+    assert target.match("persistent://public/default/orders-eu")
+
+
+def test_qualified_pattern_is_kept():
+    target = subscription_topic(topic_pattern="non-persistent://tenant/ns/.*")
+
+    assert target.pattern == "non-persistent://tenant/ns/.*"
+
+
+def test_invalid_pattern_raises_value_error():
+    with pytest.raises(ValueError, match="Invalid topic_pattern"):
+        subscription_topic(topic_pattern="orders-(")
+
+
+def test_topics_win_over_topic():
+    assert subscription_topic(topic="t", topics=["a", "b"]) == ["a", "b"]
+
+
+def test_single_item_topics_list_collapses_to_its_topic():
+    assert subscription_topic(topic="t", topics=["a"]) == "a"
+
+
+def test_topic_is_used_when_nothing_else_is_given():
+    assert subscription_topic(topic="t", topics=[]) == "t"
+
+
+def test_describe_topic():
+    assert describe_topic("t") == "t"
+    assert describe_topic(["a", "b"]) == "a,b"
+    assert describe_topic(re.compile("persistent://public/default/x-.*")) == "persistent://public/default/x-.*"
+
+
+def test_topic_key_ignores_topic_order(connector):
+    assert connector._topic_key(["a", "b"]) == connector._topic_key(["b", "a"])
+    assert connector._topic_key("a") != connector._topic_key(["a"])
+    assert connector._topic_key(re.compile("a")) != connector._topic_key("a")
+
+
+def test_reordered_topics_share_a_pooled_consumer(connector):
+    connector.client = client = FakeClient()
+
+    async def get_both():
+        first = await connector._get_consumer(["a", "b"], "sub")
+        second = await connector._get_consumer(["b", "a"], "sub")
+        return first, second
+
+    first, second = asyncio.run(get_both())
+
+    assert first is second
+    assert client.subscribed_topics == [["a", "b"]]
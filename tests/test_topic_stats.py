@@ -0,0 +1,85 @@
+from pulsar_mcp_server.topic_stats import aggregate_partitions, derive_rates, take_snapshot, total_backlog
+
+
+def partition(rate_in: float, backlog: int = 0, throughput_in: float = 0.0) -> dict:
+    return {
+        "msgRateIn": rate_in,
+        "msgThroughputIn": throughput_in,
+        "msgRateOut": rate_in,
+        "storageSize": 100,
+        "subscriptions": {"sub": {"msgBacklog": backlog}},
+    }
+
+
+def test_total_backlog_sums_subscriptions():
+    stats = {"subscriptions": {"a": {"msgBacklog": 3}, "b": {"msgBacklog": None}, "c": {}}}
+
+    assert total_backlog(stats) == 3
+    assert total_backlog({}) == 0
+
+
+def test_balanced_partitions_have_no_skew():
+    result = aggregate_partitions({f"t-partition-{i}": partition(10, backlog=5) for i in range(4)})
+
+    assert result["partition_count"] == 4
+    assert result["totals"]["msgRateIn"] == 40
+    assert result["totals"]["backlog"] == 20
+    assert result["skew"]["msgRateIn"]["max_to_mean"] == 1.0
+    assert result["skew"]["msgRateIn"]["coefficient_of_variation"] == 0.0
+
+
+def test_skewed_partitions_rank_hottest_first():
+    result = aggregate_partitions({
+        "p0": partition(10, throughput_in=1),
+        "p1": partition(30, throughput_in=1),
+        "p2": partition(10, throughput_in=5),
+        "p3": partition(0),
+    }, top_n=2)
+
+    assert [p["partition"] for p in result["hottest_partitions"]] == ["p1", "p2"]
+    assert result["hottest_partitions"][0]["share_of_rate_in"] == 0.6
+    assert result["skew"]["msgRateIn"]["max_to_mean"] == 2.4
+    assert result["skew"]["msgRateIn"]["coefficient_of_variation"] == 0.872
+
+
+def test_idle_partitions_report_no_ratios():
+    result = aggregate_partitions({"p0": partition(0), "p1": partition(0)})
+
+    assert result["skew"]["msgRateIn"]["max_to_mean"] is None
+    assert result["hottest_partitions"][0]["share_of_rate_in"] is None
+
+
+def snapshot(timestamp: float, backlog: int, counter_in: int, counter_out: int) -> dict:
+    stats = {
+        "subscriptions": {"sub": {"msgBacklog": backlog}},
+        "msgInCounter": counter_in,
+        "msgOutCounter": counter_out,
+        "msgRateIn": 1.0,
+        "msgRateOut": 2.0,
+    }
+    return take_snapshot(stats, timestamp)
+
+
+def test_derive_rates_from_draining_backlog():
+    rates = derive_rates([snapshot(100, 1000, 0, 0), snapshot(110, 800, 500, 700)])
+
+    assert rates["window_seconds"] == 10
+    assert rates["backlog_growth_per_second"] == -20
+    assert rates["time_to_drain_seconds"] == 40
+    assert rates["subscription_lag_velocity"] == {"sub": -20}
+    assert (rates["rate_in"], rates["rate_out"]) == (50, 70)
+
+
+def test_derive_rates_growing_backlog_never_drains():
+    rates = derive_rates([snapshot(100, 10, 0, 0), snapshot(105, 60, 0, 0)])
+
+    assert rates["backlog_growth_per_second"] == 10
+    assert rates["time_to_drain_seconds"] is None
+
+
+def test_derive_rates_needs_two_snapshots():
+    rates = derive_rates([snapshot(100, 10, 0, 0)])
+
+    assert rates["window_seconds"] == 0.0
+    assert "backlog_growth_per_second" not in rates
+    assert rates["backlog"] == 10